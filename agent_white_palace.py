@@ -10,7 +10,10 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, List
 from livekit.agents.voice.agent_session import SessionConnectOptions
 from livekit.agents.types import APIConnectOptions
-from backend.prompt import SYSTEM_PROMPT
+from backend.prompt import (ATTACHED_TOOLS_NOTE, SYSTEM_PROMPT, SESSION_CONTEXT_PROMPT, TURN_CONTEXT_PROMPT,
+                            render_prompt, render_system_prompt)
+from backend.dialogue_fsm import CancellationFlow, CancelEvent, CANCEL_REFUSED, SilenceStrikes
+from backend.restaurant_info import RESTAURANT_PHONE_SPEECH, RESTAURANT_PROMPT_VALUES
 import aiohttp
 from pydantic import BaseModel, Field
 
@@ -38,6 +41,10 @@ class ConversationState:
     def __init__(self):
         self.start_time = datetime.now()
         self.caller_phone = "+10000000000"
+        # Cancel tools are gated by these state machines, not by the prompt
+        self.order_cancellation = CancellationFlow()
+        self.reservation_cancellation = CancellationFlow()
+        self.silence = SilenceStrikes(RESTAURANT_PHONE_SPEECH)
 
     def to_context(self) -> str:
         now = datetime.now()
@@ -51,6 +58,17 @@ TODAY: {now.strftime('%Y-%m-%d')}
 TOMORROW: {(now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)).strftime('%Y-%m-%d')}
 """
 
+def _cancellation(context: RunContext, kind: str) -> Optional[CancellationFlow]:
+    """The call's cancellation state machine for 'order' or 'reservation'"""
+    state = getattr(context.session, "conversation_state", None)
+    return getattr(state, f"{kind}_cancellation", None)
+
+def _record_lookup(context: RunContext, kind: str, number: str, found: bool) -> None:
+    """Feed a get_*_by_number result into the cancellation state machine"""
+    flow = _cancellation(context, kind)
+    if flow is not None:
+        flow.fire(CancelEvent.LOOKUP_FOUND if found else CancelEvent.LOOKUP_MISSED, number)
+
 class OrderItem(BaseModel):
     menuItemId: int
     name: str
@@ -549,7 +567,7 @@ async def get_location(context: RunContext) -> Dict:
     # Hardcoded from restaurant_config.py
     description = (
         "We're located at 1159 South Canal Street in Chicago, Illinois. "
-        "You can reach us at 3 1 2, 9 3 9, 7 1 6 7. "
+        f"You can reach us at {RESTAURANT_PHONE_SPEECH}. "
         "There's street parking nearby and some paid parking lots in the area."
     )
     
@@ -602,6 +620,8 @@ async def get_order_by_number(
                             matching_order = order
                             break
                     
+                    _record_lookup(context, "order", orderNumber, matching_order is not None)
+                    
                     if matching_order:
                         status = matching_order.get("status", "unknown")
                         total = matching_order.get("totalPrice", 0)
@@ -687,6 +707,12 @@ async def cancel_order_by_number(
     """
     print(f"❌ CANCEL ORDER: {orderNumber}")
     
+    flow = _cancellation(context, "order")
+    if flow is not None:
+        if not flow.can_cancel(orderNumber):
+            return CANCEL_REFUSED
+        flow.fire(CancelEvent.CANCELLED)
+    
     description = f"I've cancelled order {orderNumber}. If you have any questions, feel free to ask."
     
     return {
@@ -731,6 +757,8 @@ async def get_reservation_by_number(
                             matching_res = res
                             break
                     
+                    _record_lookup(context, "reservation", reservationNumber, matching_res is not None)
+                    
                     if matching_res:
                         party_size = matching_res.get("partySize", 0)
                         res_date = matching_res.get("reservationDate", "")
@@ -820,6 +848,12 @@ async def cancel_reservation_by_number(
     """
     print(f"❌ CANCEL RESERVATION: {reservationNumber}")
     
+    flow = _cancellation(context, "reservation")
+    if flow is not None:
+        if not flow.can_cancel(reservationNumber):
+            return CANCEL_REFUSED
+        flow.fire(CancelEvent.CANCELLED)
+    
     description = f"I've cancelled reservation {reservationNumber}. If you'd like to make a new reservation, just let me know!"
     
     return {
@@ -860,23 +894,16 @@ async def entrypoint(ctx: JobContext):
 
     print(f"📞 Caller phone: {conversation_state.caller_phone}")
 
-    # Build system prompt with live state and current datetime
+    # Build system prompt: the static prompt, then the call's session and time blocks
     now = datetime.now()
-    system_prompt = RESTAURANT_SYSTEM_PROMPT.replace(
-        "{{conversation_state}}",
-        conversation_state.to_context()
-    ).replace(
-        "{{CURRENT_DATETIME}}", now.strftime('%Y-%m-%d %H:%M:%S')
-    ).replace(
-        "{{CURRENT_YEAR}}", str(now.year)
-    ).replace(
-        "{{TODAY}}", now.strftime('%Y-%m-%d')
-    ).replace(
-        "{{TOMORROW}}", (now.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)).strftime('%Y-%m-%d')
-    ).replace(
-        "{{CALLER_PHONE}}", conversation_state.caller_phone
-    ).replace(
-        "{{SESSION_ID}}", "local-console-session"
+    # One pass over the prompt (compiled renderer) instead of a .replace() per variable
+    system_prompt = (
+        render_system_prompt(
+            **RESTAURANT_PROMPT_VALUES,
+            tool_schemas=ATTACHED_TOOLS_NOTE,
+        )
+        + render_prompt(SESSION_CONTEXT_PROMPT, session_id=conversation_state.caller_phone, current_intent="")
+        + render_prompt(TURN_CONTEXT_PROMPT, current_datetime=now.strftime('%B %d, %Y %I:%M %p'))
     )
 
     # Create agent with instructions and tools
@@ -970,6 +997,20 @@ async def entrypoint(ctx: JobContext):
     # Attach state to session for tool access
     session.conversation_state = conversation_state
 
+    # Silence is escalated in code: a fixed line per strike, hang up on the third
+    @session.on("user_state_changed")
+    def _on_user_state_changed(ev):
+        if ev.new_state == "speaking":
+            conversation_state.silence.reset()
+        elif ev.new_state == "away":
+            asyncio.create_task(_handle_silence())
+
+    async def _handle_silence():
+        handle = session.say(conversation_state.silence.strike(), allow_interruptions=True)
+        if conversation_state.silence.exhausted:
+            await handle
+            ctx.shutdown(reason="caller silent")
+
     # Start the session - this handles the conversation loop automatically
     await session.start(room=ctx.room, agent=restaurant_agent)
 
@@ -10,21 +10,31 @@ Responsibilities:
 """
 
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 from enum import Enum, auto
+from types import MappingProxyType
 from typing import Optional, Dict, Any, List
 import re
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+
+from number_speech import NUMBER_WORD_PATTERNS, TIME_WORD_PATTERNS
 
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session for calls to the Flask API
+http_session = requests.Session()
+http_session.mount("http://", HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=0))
+http_session.headers.update({"Connection": "keep-alive"})
+
 
 
 # helper function to fetch menu items
 MENU_API_BASE = "http://localhost:5000/api/menu"
 
 def _fetch_menu_items(limit: int = 200):
-    resp = requests.get(f"{MENU_API_BASE}?limit={limit}")
+    resp = http_session.get(f"{MENU_API_BASE}?limit={limit}")
     resp.raise_for_status()
     data = resp.json()
     return data["data"]["items"]  # uses your existing format_menu_item
@@ -71,6 +81,23 @@ class Intent:
     entities: Optional[Dict[str, Any]] = None
 
 
+@dataclass(frozen=True, slots=True)
+class NormalizedText:
+    """
+    User text normalized once per turn and shared by the classifier and handlers.
+    """
+    raw: str
+    stripped: str
+    lower: str
+    tokens: List[str]
+
+    @classmethod
+    def from_text(cls, text: str) -> "NormalizedText":
+        stripped = (text or "").strip()
+        lower = stripped.lower()
+        return cls(raw=text or "", stripped=stripped, lower=lower, tokens=lower.split())
+
+
 # @dataclass
 # class SessionState:
 #     """
@@ -86,7 +113,7 @@ class Intent:
 # # In-memory sessions keyed by normalized phone number (or "anonymous")
 # sessions: Dict[str, SessionState] = {}
 
-@dataclass
+@dataclass(slots=True)
 class SessionState:
     current_intent: Optional[IntentType] = None
     order_items: List[Dict[str, Any]] = None
@@ -102,6 +129,148 @@ class SessionState:
 # In-memory sessions keyed by normalized phone number (or "anonymous")
 sessions: Dict[str, SessionState] = {}
 
+# Cancel phrases, compiled into a single alternation so the text is scanned once
+CANCEL_KEYWORDS = ("never mind", "cancel", "stop", "i changed my mind")
+CANCEL_PATTERN = re.compile("|".join(re.escape(k) for k in CANCEL_KEYWORDS))
+
+# ============================================
+# Canned responses
+# ============================================
+RESP_CANCELLED = (
+    "Okay, I've cancelled this. I can help you place an order or make a reservation if you'd like."
+)
+
+# Response envelope for the cancel branch; the scalar fields are built once,
+# the nested tables are made fresh per call (see _cancel_response)
+_CANCEL_RESPONSE = MappingProxyType({
+    "intent": "unknown",
+    "confidence": 0.0,
+    "response": RESP_CANCELLED,
+})
+
+
+def _cancel_response() -> dict:
+    """A plain, JSON-serializable copy of the cancel envelope that shares nothing mutable"""
+    return {**_CANCEL_RESPONSE, "entities": {}, "session": {"currentIntent": None, "step": None}}
+
+RESP_PARKING = (
+    "White Palace Grill has street parking nearby and some paid lots in the area. "
+    "Parking availability can vary depending on the time of day."
+)
+RESP_ADDRESS = (
+    "White Palace Grill is located at fourteen fifty five South Canal Street in Chicago. "
+    "We are open twenty four hours a day, seven days a week."
+)
+RESP_HOURS = (
+    "White Palace Grill is open twenty four hours a day, seven days a week, "
+    "at fourteen fifty five South Canal Street in Chicago."
+)
+RESP_GREETING = (
+    "Hello from White Palace Grill. "
+    "I can help you place an order, make a reservation, or answer questions about the menu."
+)
+RESP_UNKNOWN = (
+    "Sorry, I’m not sure what you meant. "
+    "You can ask to place an order, make a reservation, or ask about the menu."
+)
+
+# Menu
+RESP_MENU_DEFAULT = (
+    "I can help with the menu. "
+    "We have breakfast, burgers, sandwiches, entrees, salads, soups, sides, desserts, and beverages."
+)
+RESP_MENU_UNAVAILABLE = (
+    "I can help with the menu, but I could not load the categories right now."
+)
+
+# Order flow
+RESP_ORDER_START = (
+    "You would like to place an order. "
+    "Please tell me what you would like to order. "
+    "For example: two classic burgers and one fries."
+)
+RESP_ORDER_NO_ITEMS = (
+    "I did not catch any items. "
+    "Please say something like: one cheeseburger and one coffee."
+)
+RESP_ORDER_NO_MATCH = (
+    "I could not match those items to our menu. "
+    "Please try again and use names like classic burger, pancakes, or coffee."
+)
+RESP_ASK_ORDER_TYPE = "Is this order for pickup or delivery?"
+RESP_ASK_ORDER_NAME = "Got it. What name should I put on the order?"
+RESP_EMPTY_ORDER_NAME = "Please tell me the name for the order."
+RESP_ORDER_REJECTED = (
+    "The system could not accept that reservation, possibly due to time or availability. "
+    "Would you like to try a different time or date?"
+)
+RESP_ORDER_UNAVAILABLE = (
+    "I am having trouble creating reservations right now. "
+    "Please try again later or call the restaurant directly."
+)
+RESP_ORDER_ERROR = (
+    "I could not complete the reservation due to a technical issue. "
+    "Would you like to try again with a different time or date?"
+)
+RESP_ORDER_FAILED = (
+    "Something went wrong while placing your order. "
+    "Please try again later."
+)
+RESP_ORDER_FALLBACK = (
+    "You are placing an order. "
+    "Please tell me what you would like to order."
+)
+
+# Reservation flow
+RESP_ASK_PARTY = (
+    "You want to make a reservation. "
+    "How many people is the reservation for?"
+)
+ASK_DATE_PROMPT = (
+    "What date would you like? You can say something like, "
+    "today, tomorrow, or December 31st."
+)
+RESP_PARTY_LOOKS_LIKE_TIME = (
+    "I think you are telling me a time. First, how many people is the reservation for?"
+)
+RESP_PARTY_NOT_CAUGHT = (
+    "I did not catch the party size. "
+    "Please tell me how many people, for example: four people."
+)
+RESP_PARTY_OUT_OF_RANGE = (
+    "We can book reservations between 1 and 20 guests. "
+    "How many people is your reservation for?"
+)
+RESP_DATE_FORMAT = (
+    "Please give the date in a format like 2025-12-31, "
+    "or say today or tomorrow."
+)
+RESP_TIME_NOT_CAUGHT = (
+    "I did not catch the time. "
+    "Please say a time like 7:30 PM, eight PM, or seven thirty."
+)
+RESP_TIME_INVALID = (
+    "That time does not look valid. "
+    "Please say a time like 7:30 PM or eight PM."
+)
+RESP_EMPTY_RES_NAME = "Please tell me the name for the reservation."
+RESP_RES_REJECTED = (
+    "The system could not accept that reservation, possibly due to time or availability. "
+    "Please try a different time or date."
+)
+RESP_RES_UNAVAILABLE = (
+    "I am having trouble creating reservations right now. "
+    "Please try again later or call the restaurant directly."
+)
+RESP_RES_ERROR = (
+    "I could not complete the reservation due to a technical issue. "
+    "Please try again later."
+)
+RESP_RES_FAILED = (
+    "Something went wrong while creating your reservation. "
+    "Please try again later or call the restaurant directly."
+)
+
 # ============================================
 # Simple rule-based intent classifier
 # ============================================
@@ -165,12 +334,14 @@ class IntentClassifier:
         return any(k in t for k in self.order_type_keywords)
 
 
-    def classify(self, text: str) -> Intent:
+    def classify(self, text: NormalizedText | str) -> Intent:
         """Return Intent for a given text."""
-        if not text or not text.strip():
+        if isinstance(text, str):
+            text = NormalizedText.from_text(text)
+        if not text.stripped:
             return Intent(type=IntentType.UNKNOWN, confidence=0.0, entities={})
 
-        t = text.lower().strip()
+        t = text.lower
 
         # Small talk first
         if any(k in t for k in self.small_talk_keywords):
@@ -248,7 +419,8 @@ class RestaurantAgent:
               "session": {...}
             }
         """
-        intent = self.classifier.classify(text)
+        norm = NormalizedText.from_text(text)
+        intent = self.classifier.classify(norm)
         logger.info(
             f"Classified intent={intent.type.name}, "
             f"confidence={intent.confidence}, entities={intent.entities}"
@@ -261,24 +433,15 @@ class RestaurantAgent:
         session = sessions[session_key]
 
         # Check for cancel keywords
-        cancel_keywords = ["never mind", "cancel", "stop", "i changed my mind"]
-        if any(k in text.lower() for k in cancel_keywords):
+        if CANCEL_PATTERN.search(norm.lower):
             # Reset session
             session.current_intent = None
             session.step = None
             session.order_items = []
             session.order_type = None
             session.customer_name = None
-            return {
-                "intent": "unknown",
-                "confidence": 0.0,
-                "response": "Okay, I've cancelled this. I can help you place an order or make a reservation if you'd like.",
-                "entities": {},
-                "session": {
-                    "currentIntent": None,
-                    "step": None,
-                },
-            }
+            sessions[session_key] = session
+            return _cancel_response()
 
         # If in the middle of an order, override intent to ORDER
         if session.current_intent == IntentType.ORDER:
@@ -289,19 +452,19 @@ class RestaurantAgent:
             intent.type = IntentType.RESERVATION
 
         if intent.type == IntentType.ORDER:
-            reply = self._handle_order_intent(text, intent.entities or {}, customer_phone, session)
+            reply = self._handle_order_intent(norm, intent.entities or {}, customer_phone, session)
         elif intent.type == IntentType.RESERVATION:
-              reply = self._handle_reservation_intent(text, intent.entities or {}, customer_phone, session)
+              reply = self._handle_reservation_intent(norm, intent.entities or {}, customer_phone, session)
         elif intent.type == IntentType.MENU_QUESTION:
-            reply = self._handle_menu_intent(text, intent.entities or {})
+            reply = self._handle_menu_intent(norm, intent.entities or {})
         elif intent.type == IntentType.HOURS:
             reply = self._handle_hours_intent()
         elif intent.type == IntentType.FAQ:
-             reply = self._handle_faq_intent(text)
+             reply = self._handle_faq_intent(norm)
         elif intent.type == IntentType.SMALL_TALK:
-            reply = self._handle_small_talk(text)
+            reply = self._handle_small_talk(norm)
         else:
-            reply = self._handle_unknown(text)
+            reply = self._handle_unknown(norm)
 
         # Save updated session
         sessions[session_key] = session
@@ -317,31 +480,24 @@ class RestaurantAgent:
             },
         }
     
-    def _handle_faq_intent(self, text: str) -> str:
-        t = text.lower()
+    def _handle_faq_intent(self, text: NormalizedText) -> str:
+        t = text.lower
         if "parking" in t:
-            return (
-                "White Palace Grill has street parking nearby and some paid lots in the area. "
-                "Parking availability can vary depending on the time of day."
-            )
+            return RESP_PARKING
         # Default to location/address
-        return (
-            "White Palace Grill is located at fourteen fifty five South Canal Street in Chicago. "
-            "We are open twenty four hours a day, seven days a week."
-        )
+        return RESP_ADDRESS
 
 
     # ----------------------------------------
     # Intent handlers
     # ----------------------------------------
     
-    def _parse_items_from_text(self, text: str) -> List[Dict[str, Any]]:
+    def _parse_items_from_text(self, text: NormalizedText) -> List[Dict[str, Any]]:
         """
         Parse '<number> <word>' patterns, then map each word to a real menu item
         using /api/menu so we get real menuItemId and price.
         """
-        t = text.lower()
-        tokens = t.split()
+        tokens = text.tokens
         raw_items: list[dict] = []
 
         i = 0
@@ -398,7 +554,7 @@ class RestaurantAgent:
 
     def _handle_order_intent(
         self,
-        text: str,
+        text: NormalizedText,
         entities: Dict[str, Any],
         customer_phone: Optional[str],
         session: SessionState,
@@ -419,20 +575,13 @@ class RestaurantAgent:
             session.order_type = None
             session.customer_name = None
             session.step = "ASK_ITEMS"
-            return (
-                "You would like to place an order. "
-                "Please tell me what you would like to order. "
-                "For example: two classic burgers and one fries."
-            )
+            return RESP_ORDER_START
 
         # STEP 1: collect items
         if session.step == "ASK_ITEMS":
             items = self._parse_items_from_text(text)
             if not items:
-                return (
-                    "I did not catch any items. "
-                    "Please say something like: one cheeseburger and one coffee."
-                )
+                return RESP_ORDER_NO_ITEMS
 
             # Basic sanity checks on items
             total_qty = sum(it.get("quantity", 0) for it in items)
@@ -440,10 +589,7 @@ class RestaurantAgent:
 
             # If no recognized menu items
             if not known_items:
-                return (
-                    "I could not match those items to our menu. "
-                    "Please try again and use names like classic burger, pancakes, or coffee."
-                )
+                return RESP_ORDER_NO_MATCH
 
             # If the order is unusually large, confirm
             if total_qty > 20:
@@ -462,27 +608,27 @@ class RestaurantAgent:
             )
             return (
                 f"Great, I have {summary}. "
-                "Is this order for pickup or delivery?"
+                f"{RESP_ASK_ORDER_TYPE}"
             )
 
         # STEP 2: ask pickup vs delivery
         if session.step == "ASK_TYPE":
-            t = text.lower()
+            t = text.lower
             if "pickup" in t or "pick up" in t or "to go" in t:
                 session.order_type = "pickup"
             elif "delivery" in t or "deliver" in t:
                 session.order_type = "delivery"
             else:
-                return "Is this order for pickup or delivery?"
+                return RESP_ASK_ORDER_TYPE
 
             session.step = "ASK_NAME"
-            return "Got it. What name should I put on the order?"
+            return RESP_ASK_ORDER_NAME
 
         # STEP 3: ask for customer name
         if session.step == "ASK_NAME":
-            name = text.strip()
+            name = text.stripped
             if len(name) == 0:
-                return "Please tell me the name for the order."
+                return RESP_EMPTY_ORDER_NAME
 
             session.customer_name = name
             session.step = "CREATE_ORDER"
@@ -498,10 +644,10 @@ class RestaurantAgent:
             }
 
             try:
-                resp = requests.post(
+                resp = http_session.post(
                     "http://localhost:5000/api/orders",
                     json=payload,
-                    timeout=5,
+                    timeout=3,
                 )
                
                 if resp.status_code != 201:
@@ -515,20 +661,11 @@ class RestaurantAgent:
                     session.reservation_time = None
 
                     if resp.status_code == 400:
-                        return (
-                            "The system could not accept that reservation, possibly due to time or availability. "
-                            "Would you like to try a different time or date?"
-                        )
+                        return RESP_ORDER_REJECTED
                     elif resp.status_code >= 500:
-                        return (
-                            "I am having trouble creating reservations right now. "
-                            "Please try again later or call the restaurant directly."
-                        )
+                        return RESP_ORDER_UNAVAILABLE
                     else:
-                        return (
-                            "I could not complete the reservation due to a technical issue. "
-                            "Would you like to try again with a different time or date?"
-                        )
+                        return RESP_ORDER_ERROR
 
 
                 data = resp.json().get("data", {})
@@ -586,21 +723,15 @@ class RestaurantAgent:
                 session.order_items = []
                 session.order_type = None
                 session.customer_name = None
-                return (
-                    "Something went wrong while placing your order. "
-                    "Please try again later."
-                )
+                return RESP_ORDER_FAILED
 
         # Fallback
-        return (
-            "You are placing an order. "
-            "Please tell me what you would like to order."
-        )
+        return RESP_ORDER_FALLBACK
 
    
     def _handle_reservation_intent(
         self,
-        text: str,
+        text: NormalizedText,
         entities: Dict[str, Any],
         customer_phone: Optional[str],
         session: SessionState,
@@ -627,15 +758,11 @@ class RestaurantAgent:
                 session.step = "ASK_DATE"
                 return (
                     f"You want a reservation for {session.reservation_party_size} guests. "
-                    "What date would you like? You can say something like, "
-                    "today, tomorrow, or December 31st."
+                    f"{ASK_DATE_PROMPT}"
                 )
             else:
                 session.step = "ASK_PARTY"
-                return (
-                    "You want to make a reservation. "
-                    "How many people is the reservation for?"
-                )
+                return RESP_ASK_PARTY
 
         # STEP 1: party size
         # if session.step == "ASK_PARTY":
@@ -667,24 +794,15 @@ class RestaurantAgent:
         # STEP 1: party size
         if session.step == "ASK_PARTY":
             # Check if text looks like time, if so, don't treat as party size
-            if self.classifier._looks_like_time(text):
-                return "I think you are telling me a time. First, how many people is the reservation for?"
-
-            # Helper: convert word numbers to digits
-            number_words = {
-                'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-                'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
-                'eleven': 11, 'twelve': 12, 'thirteen': 13, 'fourteen': 14,
-                'fifteen': 15, 'sixteen': 16, 'seventeen': 17, 'eighteen': 18,
-                'nineteen': 19, 'twenty': 20
-            }
-            
-            t = text.lower().strip()
+            if self.classifier._looks_like_time(text.raw):
+                return RESP_PARTY_LOOKS_LIKE_TIME
+
+            t = text.lower
             party_size = None
             
             # Try word numbers first
-            for word, num in number_words.items():
-                if re.search(rf'\b{word}\b', t):
+            for pattern, num in NUMBER_WORD_PATTERNS:
+                if pattern.search(t):
                     party_size = num
                     break
             
@@ -695,31 +813,22 @@ class RestaurantAgent:
                     party_size = int(m.group(1))
             
             if party_size is None:
-                return (
-                    "I did not catch the party size. "
-                    "Please tell me how many people, for example: four people."
-                )
+                return RESP_PARTY_NOT_CAUGHT
             
             if party_size < 1 or party_size > 20:
-                return (
-                    "We can book reservations between 1 and 20 guests. "
-                    "How many people is your reservation for?"
-                )
+                return RESP_PARTY_OUT_OF_RANGE
 
             session.reservation_party_size = party_size
             session.step = "ASK_DATE"
             return (
                 f"Great, a table for {party_size}. "
-                "What date would you like? You can say something like, "
-                "today, tomorrow, or December 31st."
+                f"{ASK_DATE_PROMPT}"
             )
 
         # STEP 2: date
         if session.step == "ASK_DATE":
             # For now, expect an ISO-like date or simple 'today' / 'tomorrow'
-            t = text.lower().strip()
-
-            from datetime import datetime, timedelta
+            t = text.lower
 
             if "today" in t:
                 res_date = datetime.now().date().isoformat()
@@ -729,13 +838,10 @@ class RestaurantAgent:
                 # Very simple date parse: expect YYYY-MM-DD
                 # You can improve later with NLP date parsing
                 try:
-                    datetime.fromisoformat(text.strip())
-                    res_date = text.strip()
+                    datetime.fromisoformat(text.stripped)
+                    res_date = text.stripped
                 except Exception:
-                    return (
-                        "Please give the date in a format like 2025-12-31, "
-                        "or say today or tomorrow."
-                    )
+                    return RESP_DATE_FORMAT
 
             session.reservation_date = res_date
             session.step = "ASK_TIME"
@@ -786,17 +892,7 @@ class RestaurantAgent:
         #         session.step = "CREATE_RES"
         # STEP 3: time
         if session.step == "ASK_TIME":
-            t = text.lower().strip()
-            
-            # Word-to-number mapping
-            time_words = {
-                'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-                'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10,
-                'eleven': 11, 'twelve': 12,
-                'thirteen': 13, 'fourteen': 14, 'fifteen': 15, 'sixteen': 16,
-                'seventeen': 17, 'eighteen': 18, 'nineteen': 19, 'twenty': 20,
-                'thirty': 30, 'forty': 40, 'fifty': 50
-            }
+            t = text.lower
             
             hour = None
             minute = 0
@@ -819,23 +915,20 @@ class RestaurantAgent:
             # Try pattern 3: word format "eight thirty pm", "seven pm"
             else:
                 # Look for hour word
-                for word, num in time_words.items():
-                    if num <= 12 and re.search(rf'\b{word}\b', t):
+                for pattern, num in TIME_WORD_PATTERNS:
+                    if num <= 12 and pattern.search(t):
                         hour = num
                         break
                 
                 # Look for minute word (like "thirty" in "seven thirty")
                 if hour is not None:
-                    for word, num in time_words.items():
-                        if num >= 30 and re.search(rf'\b{word}\b', t):
+                    for pattern, num in TIME_WORD_PATTERNS:
+                        if num >= 30 and pattern.search(t):
                             minute = num
                             break
             
             if hour is None:
-                return (
-                    "I did not catch the time. "
-                    "Please say a time like 7:30 PM, eight PM, or seven thirty."
-                )
+                return RESP_TIME_NOT_CAUGHT
             
             # Apply AM/PM conversion
             if is_pm and hour < 12:
@@ -845,10 +938,7 @@ class RestaurantAgent:
             
             # Validate
             if hour < 0 or hour > 23 or minute < 0 or minute > 59:
-                return (
-                    "That time does not look valid. "
-                    "Please say a time like 7:30 PM or eight PM."
-                )
+                return RESP_TIME_INVALID
             
             res_time = f"{hour:02d}:{minute:02d}"
             session.reservation_time = res_time
@@ -866,9 +956,9 @@ class RestaurantAgent:
 
         # STEP 4: name
         if session.step == "ASK_NAME":
-            name = text.strip()
+            name = text.stripped
             if not name:
-                return "Please tell me the name for the reservation."
+                return RESP_EMPTY_RES_NAME
             session.customer_name = name
             session.step = "CREATE_RES"
 
@@ -885,10 +975,10 @@ class RestaurantAgent:
             }
 
             try:
-                resp = requests.post(
+                resp = http_session.post(
                     "http://localhost:5000/api/reservations",
                     json=payload,
-                    timeout=5,
+                    timeout=3,
                 )
 
                 if resp.status_code != 201:
@@ -902,20 +992,11 @@ class RestaurantAgent:
                     session.reservation_time = None
 
                     if resp.status_code == 400:
-                        return (
-                            "The system could not accept that reservation, possibly due to time or availability. "
-                            "Please try a different time or date."
-                        )
+                        return RESP_RES_REJECTED
                     elif resp.status_code >= 500:
-                        return (
-                            "I am having trouble creating reservations right now. "
-                            "Please try again later or call the restaurant directly."
-                        )
+                        return RESP_RES_UNAVAILABLE
                     else:
-                        return (
-                            "I could not complete the reservation due to a technical issue. "
-                            "Please try again later."
-                        )
+                        return RESP_RES_ERROR
 
                 data = resp.json().get("data", {})
                 res_number = data.get("reservationNumber")
@@ -944,39 +1025,28 @@ class RestaurantAgent:
                 session.reservation_party_size = None
                 session.reservation_date = None
                 session.reservation_time = None
-                return (
-                    "Something went wrong while creating your reservation. "
-                    "Please try again later or call the restaurant directly."
-                )
+                return RESP_RES_FAILED
 
         # Fallback
-        return (
-            "You want to make a reservation. "
-            "How many people is the reservation for?"
-        )
+        return RESP_ASK_PARTY
 
 
-    def _handle_menu_intent(self, text: str, entities: Dict[str, Any]) -> str:
+    def _handle_menu_intent(self, text: NormalizedText, entities: Dict[str, Any]) -> str:
         """
         Handle menu questions.
 
         Calls the /api/menu/categories endpoint to give real categories.
         """
         try:
-            resp = requests.get("http://localhost:5000/api/menu/categories", timeout=3)
+            resp = http_session.get("http://localhost:5000/api/menu/categories", timeout=3)
             if resp.status_code != 200:
                 logger.warning(f"/api/menu/categories returned {resp.status_code}")
-                return (
-                    "I can help with the menu. "
-                    "We have breakfast, burgers, sandwiches, entrees, salads, soups, sides, desserts, and beverages."
-                )
+                return RESP_MENU_DEFAULT
 
             data = resp.json()
             categories = list(data.get("categories", {}).keys())
             if not categories:
-                return (
-                    "I can help with the menu, but I could not load the categories right now."
-                )
+                return RESP_MENU_UNAVAILABLE
 
             # Build a natural list
             if len(categories) > 1:
@@ -991,31 +1061,19 @@ class RestaurantAgent:
 
         except Exception as e:
             logger.error(f"Error calling /api/menu/categories: {e}")
-            return (
-                "I can help with the menu. "
-                "We have breakfast, burgers, sandwiches, entrees, salads, soups, sides, desserts, and beverages."
-            )
+            return RESP_MENU_DEFAULT
 
     def _handle_hours_intent(self) -> str:
         """
         Handle hours/location (still static for now).
         """
-        return (
-            "White Palace Grill is open twenty four hours a day, seven days a week, "
-            "at fourteen fifty five South Canal Street in Chicago."
-        )
+        return RESP_HOURS
 
-    def _handle_small_talk(self, text: str) -> str:
-        return (
-            "Hello from White Palace Grill. "
-            "I can help you place an order, make a reservation, or answer questions about the menu."
-        )
+    def _handle_small_talk(self, text: NormalizedText) -> str:
+        return RESP_GREETING
 
-    def _handle_unknown(self, text: str) -> str:
-        return (
-            "Sorry, I’m not sure what you meant. "
-            "You can ask to place an order, make a reservation, or ask about the menu."
-        )
+    def _handle_unknown(self, text: NormalizedText) -> str:
+        return RESP_UNKNOWN
 
 
 # ============================================
@@ -5,42 +5,136 @@ Uses OpenAI GPT-4 with function calling to handle orders and reservations.
 """
 
 import os
-import json
+import re
+import asyncio
+import orjson
 import logging
-from datetime import datetime
-from typing import Dict, Any, List, Optional
-from openai import OpenAI
+import time
+import pybreaker
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from openai import OpenAI, AsyncOpenAI
 
-from config.database import execute_query
-from config.constants import HTTP_STATUS
+from config.database import execute_query, execute_prepared
+from config.constants import HTTP_STATUS, RESERVATION_STATUS
 from config.restaurant_config import RESTAURANT_CONFIG
 from utils.helpers import clean_phone_number
-from prompt import SYSTEM_PROMPT
+from middleware.error_handler import ValidationError
+from routes.orders import create_order_record
+from routes.reservations import create_reservation_record
+from utils.conversation_store import create_conversation_store
+from utils.cache import cache_get, cache_set
+from utils.llm_executor import llm_executor
+from faq import FAQ_RESPONSES, faq_classify
+from restaurant_info import RESTAURANT_PROMPT_VALUES
+from prompt import (END_TRIGGER_RE, GOODBYE_RESPONSE, SESSION_CONTEXT_PROMPT,
+                    TURN_CONTEXT_PROMPT, build_prompt, render_prompt)
 
 logger = logging.getLogger(__name__)
 
-# Initialize OpenAI client placeholder
+# Initialize OpenAI client placeholders
 _client = None
+_async_client = None
+
+def _get_openai_api_key() -> str:
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        logger.error("❌ OPENAI_API_KEY environment variable not set")
+        raise ValueError("OPENAI_API_KEY is required for the AI agent")
+    return api_key
 
 def get_openai_client():
     """Lazy initialize OpenAI client with API key validation."""
     global _client
     if _client is None:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            logger.error("❌ OPENAI_API_KEY environment variable not set")
-            raise ValueError("OPENAI_API_KEY is required for the AI agent")
-        _client = OpenAI(api_key=api_key)
+        _client = OpenAI(api_key=_get_openai_api_key())
     return _client
 
-# In-memory conversation history per session
-conversation_history: Dict[str, List[Dict[str, str]]] = {}
+def get_async_openai_client():
+    """Lazy initialize AsyncOpenAI client with API key validation."""
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncOpenAI(api_key=_get_openai_api_key())
+    return _async_client
+
+# Conversation history per session (Redis when REDIS_URL is set, else in-memory)
+MAX_HISTORY_MESSAGES = 20
+conversation_store = create_conversation_store(MAX_HISTORY_MESSAGES)
+
+# Session key of every caller without a phone number; those turns are never
+# chained, since the key is shared by unrelated callers
+ANONYMOUS_SESSION = "anonymous"
+
+# Placeholders that do not change between requests are substituted once per
+# intent. Per-call values live only in the CURRENT SESSION / CURRENT TIME
+# blocks that follow it, so the large prompt prefix is identical on every call.
+@lru_cache(maxsize=8)
+def _static_prompt(intent: Optional[str] = None) -> str:
+    """System prompt scoped to an intent (None = full prompt), rendered once and shared."""
+    return render_prompt(
+        build_prompt(intent),
+        **RESTAURANT_PROMPT_VALUES,
+        tool_schemas=TOOL_SIGNATURES,
+    )
+
+# Requests sharing a static prompt share a cache key, so OpenAI routes them to
+# the same prompt-cache shard and reuses the cached prefix (cached-input pricing)
+PROMPT_CACHE_KEY_PREFIX = "white-palace:"
+
+# Successful tool calls move a session into (or out of) a flow; the next turn
+# is sent only that flow's prompt segments. Placing the order/reservation ends it.
+_TOOL_INTENTS = {
+    "get_menu_items": "ORDER",
+    "check_reservation_availability": "RESERVATION",
+    "create_order": None,
+    "create_reservation": None,
+}
+
+# Messages that mention the other flow get the full prompt for that turn
+_OTHER_FLOW = {
+    "ORDER": re.compile(r"reserv|table|book", re.IGNORECASE),
+    "RESERVATION": re.compile(r"order|pick ?up|deliver", re.IGNORECASE),
+}
+
+# Before any tool has set the session's flow, the message alone picks the
+# prompt: a cancellation, or a clear order-only / reservation-only request.
+# Anything else (greetings, mixed or vague requests) gets the full prompt.
+_CANCEL_HINT = re.compile(r"\bcancel", re.IGNORECASE)
+_FLOW_HINTS = (
+    ("ORDER", re.compile(r"\border|pick ?up|deliver|\bto go\b|take ?out|\bcan i (?:get|have)\b", re.IGNORECASE)),
+    ("RESERVATION", re.compile(r"reserv|\bbook|\btable for\b|\bparty of\b", re.IGNORECASE)),
+)
+
+
+def guess_intent(text: str) -> Optional[str]:
+    """CANCEL, ORDER or RESERVATION when the message makes it unambiguous, else None."""
+    if _CANCEL_HINT.search(text):
+        return "CANCEL"
+    matches = [intent for intent, pattern in _FLOW_HINTS if pattern.search(text)]
+    return matches[0] if len(matches) == 1 else None
+
+# Menu changes rarely and admin availability updates clear the menu:* keys,
+# so tool lookups are cached for a while (0 disables)
+MENU_CACHE_TTL = int(os.getenv("MENU_CACHE_TTL", 900))
+
+# Trips after 3 consecutive DB failures so voice turns fail fast during an outage
+# instead of waiting on connection timeouts; validation errors do not count.
+db_breaker = pybreaker.CircuitBreaker(fail_max=3, reset_timeout=30, exclude=[ValidationError])
+SERVICE_UNAVAILABLE = {"success": False, "error": "Service temporarily unavailable"}
 
 
 # ============================================================================
 # TOOLS: LLM Function Definitions
 # ============================================================================
 
+# Slot formats the reservation tools expect, enforced by the tool schemas
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}$"
+TIME_PATTERN = r"^([01]\d|2[0-3]):[0-5]\d$"
+
 TOOLS = [
     {
         "type": "function",
@@ -126,11 +220,13 @@ TOOLS = [
                     },
                     "reservationDate": {
                         "type": "string",
-                        "description": "Reservation date in YYYY-MM-DD format"
+                        "description": "Reservation date in YYYY-MM-DD format",
+                        "pattern": DATE_PATTERN
                     },
                     "reservationTime": {
                         "type": "string",
-                        "description": "Reservation time in HH:MM 24-hour format (e.g., '19:30' for 7:30 PM)"
+                        "description": "Reservation time in HH:MM 24-hour format (e.g., '19:30' for 7:30 PM)",
+                        "pattern": TIME_PATTERN
                     },
                     "customerName": {
                         "type": "string",
@@ -163,11 +259,13 @@ TOOLS = [
             "properties": {
                 "reservationDate": {
                     "type": "string",
-                    "description": "Reservation date in YYYY-MM-DD format"
+                    "description": "Reservation date in YYYY-MM-DD format",
+                    "pattern": DATE_PATTERN
                 },
                 "reservationTime": {
                     "type": "string",
-                    "description": "Reservation time in HH:MM 24-hour format"
+                    "description": "Reservation time in HH:MM 24-hour format",
+                    "pattern": TIME_PATTERN
                 },
                 "partySize": {
                     "type": "integer",
@@ -180,13 +278,105 @@ TOOLS = [
     },
 ]
 
+def _strict_schema(schema: Dict[str, Any], required: bool = True) -> Dict[str, Any]:
+    """
+    Make a parameters schema valid for strict function calling: every object
+    closes its properties and requires all of them, and properties that were
+    optional become nullable (the model sends null instead of omitting them).
+    """
+    schema = dict(schema)
+    if schema.get("type") == "object":
+        optional = set(schema["properties"]) - set(schema.get("required", ()))
+        schema["properties"] = {
+            name: _strict_schema(prop, name not in optional)
+            for name, prop in schema["properties"].items()
+        }
+        schema["required"] = list(schema["properties"])
+        schema["additionalProperties"] = False
+    elif schema.get("type") == "array":
+        schema["items"] = _strict_schema(schema["items"])
+    
+    if not required:
+        schema["type"] = [schema["type"], "null"]
+        if "enum" in schema:
+            schema["enum"] = [*schema["enum"], None]
+    return schema
+
+
+def _type_signature(schema: Dict[str, Any]) -> str:
+    """Compact type of one schema node: string, "a" | "b", [{...}, ...]."""
+    if "enum" in schema:
+        return " | ".join(f'"{value}"' for value in schema["enum"])
+    if schema.get("type") == "array":
+        return f"[{_type_signature(schema['items'])}, ...]"
+    if schema.get("type") == "object":
+        return "{" + _fields_signature(schema) + "}"
+    return schema.get("type", "any")
+
+
+def _fields_signature(schema: Dict[str, Any]) -> str:
+    required = set(schema.get("required", ()))
+    return ", ".join(
+        f"{name}{'' if name in required else '?'}: {_type_signature(prop)}"
+        for name, prop in schema.get("properties", {}).items()
+    )
+
+
+def _tool_signatures(tools: List[Dict[str, Any]]) -> str:
+    """One `name(arg: type, optional?: type)` line per tool, for the prompt's TOOL SCHEMAS section."""
+    return "\n\n".join(
+        f"{tool['function']['name']}({_fields_signature(tool['function']['parameters'])})\n"
+        f"  {tool['function']['description']}"
+        for tool in tools
+    )
+
+
+# Rendered from TOOLS so the prompt can never drift from the real schemas
+TOOL_SIGNATURES = _tool_signatures(TOOLS)
+
+
+# Responses API expects the function fields flattened into the tool object.
+# Strict mode makes the model's arguments always match the schema, so tool
+# arguments need no re-validation or repair before dispatch.
+RESPONSES_TOOLS = [
+    {
+        "type": "function",
+        **tool["function"],
+        "parameters": _strict_schema(tool["function"]["parameters"]),
+        "strict": True
+    }
+    for tool in TOOLS
+]
+
+
+def function_calls_to_chat(calls) -> Dict[str, Any]:
+    """Translate Responses API function_call items into a chat-format assistant message."""
+    return {
+        "role": "assistant",
+        "content": None,
+        "tool_calls": [
+            {
+                "id": call.call_id,
+                "type": "function",
+                "function": {"name": call.name, "arguments": call.arguments}
+            }
+            for call in calls
+        ]
+    }
+
 
 # ============================================================================
 # TOOL IMPLEMENTATIONS
 # ============================================================================
 
 def tool_get_menu_items(category: Optional[str] = None, search: Optional[str] = None) -> Dict[str, Any]:
-    """Fetch menu items from database."""
+    """Fetch menu items from database (cached for MENU_CACHE_TTL seconds, per category/search)."""
+    cache_key = f"menu:{category or ''}:{(search or '').lower()}"
+    if MENU_CACHE_TTL > 0:
+        cached = cache_get(cache_key)
+        if cached is not None:
+            return cached
+    
     try:
         sql = """
             SELECT id, name, description, price, category, available
@@ -205,7 +395,7 @@ def tool_get_menu_items(category: Optional[str] = None, search: Optional[str] =
         
         sql += " ORDER BY category, name LIMIT 50"
         
-        rows = execute_query(sql, tuple(params) if params else None, fetch_all=True)
+        rows = db_breaker.call(execute_query, sql, tuple(params) if params else None, fetch_all=True)
         
         items = []
         for row in rows:
@@ -217,12 +407,17 @@ def tool_get_menu_items(category: Optional[str] = None, search: Optional[str] =
                 "category": row[4]
             })
         
-        return {
+        result = {
             "success": True,
             "items": items,
             "count": len(items)
         }
+        if MENU_CACHE_TTL > 0:
+            cache_set(cache_key, result, MENU_CACHE_TTL)
+        return result
     
+    except pybreaker.CircuitBreakerError:
+        return {**SERVICE_UNAVAILABLE, "items": []}
     except Exception as e:
         logger.error(f"Error fetching menu items: {e}")
         return {"success": False, "error": str(e), "items": []}
@@ -238,9 +433,7 @@ def tool_create_order(
     deliveryAddress: Optional[str] = None,
     specialRequests: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Create order by calling internal /api/orders logic."""
-    import requests
-    
+    """Create order in-process using the same logic as POST /api/orders."""
     # Use alternate phone if provided, otherwise use caller's phone
     contact_phone = alternatePhone if alternatePhone else customerPhone
     
@@ -253,29 +446,20 @@ def tool_create_order(
         "specialRequests": specialRequests
     }
     try:
-        # Call internal Flask endpoint
-        resp = requests.post(
-            "http://localhost:5000/api/orders",
-            json=payload,
-            timeout=10
-        )
-        
-        if resp.status_code == 201:
-            data = resp.json().get("data", {})
-            return {
-                "success": True,
-                "orderNumber": data.get("orderNumber"),
-                "totalPrice": data.get("totalPrice"),
-                "estimatedReadyTime": data.get("estimatedReadyTime"),
-                "orderType": data.get("orderType"),
-                "orderItems": data.get("orderItems")
-            }
-        else:
-            return {
-                "success": False,
-                "error": resp.json().get("message", "Failed to create order")
-            }
+        data = db_breaker.call(create_order_record, payload)
+        return {
+            "success": True,
+            "orderNumber": data.get("orderNumber"),
+            "totalPrice": data.get("totalPrice"),
+            "estimatedReadyTime": data.get("estimatedReadyTime"),
+            "orderType": data.get("orderType"),
+            "orderItems": data.get("orderItems")
+        }
     
+    except ValidationError as e:
+        return {"success": False, "error": e.message or "Failed to create order"}
+    except pybreaker.CircuitBreakerError:
+        return dict(SERVICE_UNAVAILABLE)
     except Exception as e:
         logger.error(f"Error creating order: {e}")
         return {"success": False, "error": str(e)}
@@ -290,8 +474,7 @@ def tool_create_reservation(
     customerEmail: Optional[str] = None,
     specialRequests: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Create reservation by calling internal /api/reservations logic."""
-    import requests
+    """Create reservation in-process using the same logic as POST /api/reservations."""
     
     contact_phone = alternatePhone if alternatePhone else customerPhone
 
@@ -307,43 +490,118 @@ def tool_create_reservation(
     }
     
     try:
-        resp = requests.post(
-            "http://localhost:5000/api/reservations",
-            json=payload,
-            timeout=10
-        )
-        
-        if resp.status_code == 201:
-            data = resp.json().get("data", {})
-            return {
-                "success": True,
-                "reservationNumber": data.get("reservationNumber"),
-                "partySize": data.get("partySize"),
-                "reservationDate": data.get("reservationDate"),
-                "reservationTime": data.get("reservationTime")
-            }
-        else:
-            return {
-                "success": False,
-                "error": resp.json().get("message", "Failed to create reservation")
-            }
+        data = db_breaker.call(create_reservation_record, payload)
+        return {
+            "success": True,
+            "reservationNumber": data.get("reservationNumber"),
+            "partySize": data.get("partySize"),
+            "reservationDate": data.get("reservationDate"),
+            "reservationTime": data.get("reservationTime")
+        }
     
+    except ValidationError as e:
+        return {"success": False, "error": e.message or "Failed to create reservation"}
+    except pybreaker.CircuitBreakerError:
+        return dict(SERVICE_UNAVAILABLE)
     except Exception as e:
         logger.error(f"Error creating reservation: {e}")
         return {"success": False, "error": str(e)}
 
+def _count_conflicts(reservation_date: str, reservation_time: str) -> int:
+    """Reservations within 90 minutes of a slot."""
+    params = (
+        RESTAURANT_CONFIG["id"],
+        reservation_date,
+        [
+            RESERVATION_STATUS["PENDING"],
+            RESERVATION_STATUS["CONFIRMED"],
+            RESERVATION_STATUS["COMPLETED"]
+        ],
+        reservation_time
+    )
+    
+    row = db_breaker.call(execute_prepared, "reservation_conflicts", params, fetch_one=True, fetch_all=False)
+    return row["conflict_count"] if row else 0
+
+
+# During a reservation, a slot the caller names ("tomorrow at 7 pm") is
+# checked in the background while the LLM is still thinking; the availability
+# tool then picks up that in-flight query instead of starting its own. Each
+# session holds at most one speculated slot, used only within the turn that
+# started it: the entry is dropped when the turn ends.
+_SLOT_DATE = re.compile(r"\b(today|tonight|tomorrow|\d{4}-\d{2}-\d{2})\b", re.IGNORECASE)
+_SLOT_TIME = re.compile(r"\b(\d{1,2})(?::(\d{2}))?\s*([ap])\.?m\b|\b(\d{1,2}):(\d{2})\b", re.IGNORECASE)
+MAX_SPECULATIVE_SLOTS = 64
+_speculation_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="slot-speculation")
+_speculative_slots: "OrderedDict[str, tuple]" = OrderedDict()
+_speculative_lock = threading.Lock()
+
+
+def _parse_slot(text: str) -> Optional[tuple]:
+    """(YYYY-MM-DD, HH:MM) when a message names both a date and a time."""
+    date_match = _SLOT_DATE.search(text)
+    time_match = _SLOT_TIME.search(text)
+    if date_match is None or time_match is None:
+        return None
+    
+    day = date_match.group(1).lower()
+    if day == "tomorrow":
+        slot_date = (datetime.now() + timedelta(days=1)).date().isoformat()
+    elif day in ("today", "tonight"):
+        slot_date = datetime.now().date().isoformat()
+    else:
+        slot_date = day
+    
+    hour, minute, meridiem, hour_24, minute_24 = time_match.groups()
+    if hour_24 is not None:
+        hour, minute = int(hour_24), int(minute_24)
+    else:
+        hour = int(hour) % 12 + (12 if meridiem.lower() == "p" else 0)
+        minute = int(minute or 0)
+    if hour > 23 or minute > 59:
+        return None
+    return slot_date, f"{hour:02d}:{minute:02d}"
+
+
+def speculate_reservation_slot(session_key: str, text: str) -> None:
+    """Start the conflict query for a slot named in `text`, if any, for this session's turn."""
+    # Concurrent anonymous callers share a key, so they could take each other's count
+    if session_key == ANONYMOUS_SESSION:
+        return
+    slot = _parse_slot(text)
+    if slot is None:
+        return
+    
+    with _speculative_lock:
+        _speculative_slots[session_key] = (slot, _speculation_pool.submit(_count_conflicts, *slot))
+        _speculative_slots.move_to_end(session_key)
+        while len(_speculative_slots) > MAX_SPECULATIVE_SLOTS:
+            _speculative_slots.popitem(last=False)
+
+
+def _take_speculative_count(session_key: Optional[str], reservation_date: str,
+                            reservation_time: str) -> Optional[Future]:
+    """The conflict query speculated this turn for this session and slot, if any."""
+    with _speculative_lock:
+        entry = _speculative_slots.pop(session_key, None)
+    if entry is None or entry[0] != (reservation_date, reservation_time[:5]):
+        return None
+    return entry[1]
+
+
+def _drop_speculation(session_key: str) -> None:
+    """Forget the session's speculated slot once its turn is over."""
+    with _speculative_lock:
+        _speculative_slots.pop(session_key, None)
+
+
 def tool_check_reservation_availability(
     reservationDate: str,
     reservationTime: str,
-    partySize: int
+    partySize: int,
+    session_key: Optional[str] = None
 ) -> Dict[str, Any]:
     """Check if a reservation slot is available."""
-    from config.database import execute_query
-    from config.constants import RESERVATION_STATUS
-    from config.restaurant_config import RESTAURANT_CONFIG
-    from utils.helpers import is_time_slot_available
-    from datetime import datetime
-    
     try:
         # Validate the requested time is in the future
         requested_dt = datetime.fromisoformat(f"{reservationDate}T{reservationTime}")
@@ -356,38 +614,17 @@ def tool_check_reservation_availability(
                 "message": "That time has already passed. Please choose a future date and time."
             }
         
-        # Fetch existing reservations for that date
-        sql = """
-            SELECT reservation_time, party_size
-            FROM reservations
-            WHERE restaurant_id = %s
-            AND reservation_date = %s
-            AND status IN (%s, %s, %s)
-        """
-        params = (
-            RESTAURANT_CONFIG["id"],
-            reservationDate,
-            RESERVATION_STATUS["PENDING"],
-            RESERVATION_STATUS["CONFIRMED"],
-            RESERVATION_STATUS["COMPLETED"]
-        )
-        
-        existing = execute_query(sql, params, fetch_all=True)
+        # Reservations within 90 minutes of requested time on that date;
+        # reuse the query speculated for this slot during this turn if there is one
+        speculative = _take_speculative_count(session_key, reservationDate, reservationTime)
+        if speculative is not None:
+            conflict_count = speculative.result()
+        else:
+            conflict_count = _count_conflicts(reservationDate, reservationTime)
         
         # Check capacity (simple version: max 10 concurrent reservations per time slot)
         max_concurrent = 10
         
-        # Count reservations within 90 minutes of requested time
-        conflict_count = 0
-        for row in existing:
-            existing_time_str = row[0].strftime("%H:%M") if hasattr(row[0], 'strftime') else str(row[0])
-            existing_dt = datetime.fromisoformat(f"{reservationDate}T{existing_time_str}")
-            
-            # Check if within 90 minutes
-            time_diff_minutes = abs((requested_dt - existing_dt).total_seconds() / 60)
-            if time_diff_minutes < 90:
-                conflict_count += 1
-        
         if conflict_count >= max_concurrent:
             return {
                 "success": True,
@@ -409,16 +646,111 @@ def tool_check_reservation_availability(
             "message": "I'm having trouble checking availability right now. Let me try to make the reservation anyway."
         }
 
+def _with_caller_phone(tool):
+    """Wrap a tool so customerPhone always comes from the caller ID, not the LLM."""
+    def run(arguments: Dict[str, Any], customer_phone: Optional[str]) -> Dict[str, Any]:
+        return tool(**{**arguments, "customerPhone": customer_phone or ""})
+    return run
+
+
+def _without_caller_phone(tool):
+    def run(arguments: Dict[str, Any], customer_phone: Optional[str]) -> Dict[str, Any]:
+        return tool(**arguments)
+    return run
+
+
+def _with_session_key(tool):
+    """Wrap a tool that reuses the session's speculated work; the key comes from the caller ID."""
+    def run(arguments: Dict[str, Any], customer_phone: Optional[str]) -> Dict[str, Any]:
+        return tool(**{**arguments, "session_key": customer_phone or ANONYMOUS_SESSION})
+    return run
+
+
+TOOL_DISPATCH = {
+    "get_menu_items": _without_caller_phone(tool_get_menu_items),
+    "create_order": _with_caller_phone(tool_create_order),
+    "create_reservation": _with_caller_phone(tool_create_reservation),
+    "check_reservation_availability": _with_session_key(tool_check_reservation_availability),
+}
+
+
+def execute_tool(function_name: str, arguments: Dict[str, Any], customer_phone: Optional[str]) -> Dict[str, Any]:
+    """Run a single tool call requested by the LLM."""
+    logger.info(f"LLM calling tool: {function_name} with args: {arguments}")
+
+    run = TOOL_DISPATCH.get(function_name)
+    if run is None:
+        return {"error": "Unknown tool"}
+    return run(arguments, customer_phone)
+
+
+# Tools that write; they never run concurrently with each other or with reads
+SIDE_EFFECT_TOOLS = frozenset({"create_order", "create_reservation"})
+
+# Spoken by the streaming path while tools and the follow-up LLM call run
+TOOL_FILLERS = {
+    "get_menu_items": "Let me check the menu.",
+    "create_order": "Let me get that order in.",
+    "create_reservation": "Let me book that for you.",
+    "check_reservation_availability": "Checking availability.",
+}
+
+
+def _split_tool_calls(tool_calls, customer_phone: Optional[str]):
+    """(jobs, indexes of the read-only jobs) for one LLM turn's tool calls."""
+    jobs = [(call.name, orjson.loads(call.arguments), customer_phone) for call in tool_calls]
+    reads = [i for i, job in enumerate(jobs) if job[0] not in SIDE_EFFECT_TOOLS]
+    return jobs, reads
+
+
+def execute_tool_calls(tool_calls, customer_phone: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Run every tool call from one LLM turn.
+
+    Read-only tools block on HTTP/DB IO, so they run concurrently; tools
+    with side effects then run one at a time in the order the LLM asked.
+    Results are returned in the same order as the calls.
+    """
+    jobs, reads = _split_tool_calls(tool_calls, customer_phone)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+
+    if len(reads) > 1:
+        with ThreadPoolExecutor(max_workers=len(reads)) as executor:
+            for i, result in zip(reads, executor.map(lambda i: execute_tool(*jobs[i]), reads)):
+                results[i] = result
+
+    for i, job in enumerate(jobs):
+        if results[i] is None:
+            results[i] = execute_tool(*job)
+    return results
+
+
+async def execute_tool_calls_async(tool_calls, customer_phone: Optional[str]) -> List[Dict[str, Any]]:
+    """Async variant of execute_tool_calls; each blocking tool runs in a worker thread."""
+    jobs, reads = _split_tool_calls(tool_calls, customer_phone)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+
+    read_results = await asyncio.gather(*(asyncio.to_thread(execute_tool, *jobs[i]) for i in reads))
+    for i, result in zip(reads, read_results):
+        results[i] = result
+
+    for i, job in enumerate(jobs):
+        if results[i] is None:
+            results[i] = await asyncio.to_thread(execute_tool, *job)
+    return results
+
+
 # ============================================================================
 # MAIN AGENT CLASS
 # ============================================================================
 ## helper functions
 # In the handle_message method, add this helper function at the top of the file:
 
+_NON_DIGIT = re.compile(r'\D')
+
 def format_phone_display(phone: str) -> str:
     """Format phone for voice-friendly display."""
-    import re
-    cleaned = re.sub(r'[^\d]', '', phone)
+    cleaned = _NON_DIGIT.sub('', phone)
     if len(cleaned) == 10:
         return f"{cleaned[:3]}-{cleaned[3:6]}-{cleaned[6:]}"
     elif len(cleaned) == 11 and cleaned[0] == '1':
@@ -426,6 +758,51 @@ def format_phone_display(phone: str) -> str:
     return phone
 
 
+# What each session's response chain has already been told: (intent, when
+# the clock was last sent). Earlier context messages stay in the server-side
+# chain, so later turns resend the session block only when the intent changes
+# and the clock only once it has drifted by CLOCK_RESEND_SECONDS.
+CLOCK_RESEND_SECONDS = 300
+MAX_SESSION_CONTEXTS = 1024
+_sent_contexts: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+_sent_contexts_lock = threading.Lock()
+
+
+def _turn_context(session_key: str, intent: Optional[str], chained: bool) -> Optional[str]:
+    """
+    The developer context for this turn: the CURRENT SESSION block and the
+    clock, or on a chained turn only what the chain has not seen yet.
+    None when there is nothing new to send.
+    """
+    now = time.time()
+    with _sent_contexts_lock:
+        sent = _sent_contexts.get(session_key) if chained else None
+        send_session = sent is None or sent[0] != intent
+        send_clock = sent is None or now - sent[1] >= CLOCK_RESEND_SECONDS
+        _sent_contexts[session_key] = (intent, now if send_clock else sent[1])
+        _sent_contexts.move_to_end(session_key)
+        while len(_sent_contexts) > MAX_SESSION_CONTEXTS:
+            _sent_contexts.popitem(last=False)
+    
+    parts = []
+    if send_session:
+        parts.append(render_prompt(
+            SESSION_CONTEXT_PROMPT,
+            session_id=format_phone_display(session_key),
+            current_intent=intent or "",
+        ))
+    if send_clock:
+        current_time = datetime.fromtimestamp(now).strftime("%B %d, %Y %I:%M %p")
+        parts.append(render_prompt(TURN_CONTEXT_PROMPT, current_datetime=current_time))
+    return "".join(parts) or None
+
+
+def _forget_session_context(session_key: str) -> None:
+    """Drop what a session's chain was told, so its next turn sends the full context."""
+    with _sent_contexts_lock:
+        _sent_contexts.pop(session_key, None)
+
+
 class LLMAgent:
     """LLM-powered restaurant agent using OpenAI function calling."""
     
@@ -433,6 +810,158 @@ class LLMAgent:
         self.model = "gpt-4o-mini"
         self.temperature = 0.3
     
+    def _build_system_prompt(self, session_key: str, text: str,
+                             previous_response_id: Optional[str]) -> Tuple[str, List[Dict[str, str]], str]:
+        """
+        Split the system prompt into the static instructions and a per-turn
+        context message.
+        
+        The instructions are the shared static prompt itself (no per-session
+        copy) and stay byte-identical, so OpenAI's prefix cache covers them and
+        the chained history behind them; the session block and the clock go in
+        a developer message ahead of the user's input instead, and only when
+        the response chain has not already seen them (see _turn_context).
+        
+        Returns the instructions, the context items to send before the user
+        message (empty or one developer message) and the prompt cache key.
+        """
+        intent = conversation_store.get_intent(session_key)
+        if intent is None:
+            intent = guess_intent(text)
+        elif intent in _OTHER_FLOW and _OTHER_FLOW[intent].search(text):
+            intent = None
+        if intent == "RESERVATION":
+            # Overlap the availability query with the LLM call that will ask for it
+            speculate_reservation_slot(session_key, text)
+        context = _turn_context(session_key, intent, previous_response_id is not None)
+        context_items = [{"role": "developer", "content": context}] if context else []
+        return _static_prompt(intent), context_items, f"{PROMPT_CACHE_KEY_PREFIX}{intent or 'ALL'}"
+    
+    def _request(self, system_prompt: str, prompt_cache_key: str, input_items: List[Dict[str, Any]],
+                 previous_response_id: Optional[str], max_output_tokens: int) -> Dict[str, Any]:
+        """Keyword arguments for a Responses API call."""
+        return {
+            "model": self.model,
+            "instructions": system_prompt,
+            "input": input_items,
+            "previous_response_id": previous_response_id,
+            "tools": RESPONSES_TOOLS,
+            "temperature": self.temperature,
+            "max_output_tokens": max_output_tokens,
+            # Long chains drop their oldest turns instead of failing at the context limit
+            "truncation": "auto",
+            # Sent as a raw body field so older SDK versions pass it through
+            "extra_body": {"prompt_cache_key": prompt_cache_key}
+        }
+    
+    @staticmethod
+    def _record_tool_results(turn: List[Dict[str, Any]], tool_calls, tool_results) -> List[Dict[str, Any]]:
+        """
+        Add tool calls and results to the turn transcript and return the
+        function_call_output items for the follow-up LLM call.
+        """
+        tool_outputs = [orjson.dumps(result, default=str).decode() for result in tool_results]
+        
+        # One tool message per call
+        turn.append(function_calls_to_chat(tool_calls))
+        for tool_call, tool_output in zip(tool_calls, tool_outputs):
+            turn.append({
+                "role": "tool",
+                "tool_call_id": tool_call.call_id,
+                "name": tool_call.name,
+                "content": tool_output
+            })
+        
+        return [
+            {
+                "type": "function_call_output",
+                "call_id": tool_call.call_id,
+                "output": tool_output
+            }
+            for tool_call, tool_output in zip(tool_calls, tool_outputs)
+        ]
+    
+    @staticmethod
+    def _finish_turn(session_key: str, turn: List[Dict[str, Any]], response_id: Optional[str], reply: str,
+                     tool_calls=None, tool_results=None) -> Dict[str, Any]:
+        """
+        Persist the turn and build the handler result.
+        
+        A response_id of None (the response broke off mid-stream) leaves the
+        chain on the previous response.
+        """
+        turn.append({"role": "assistant", "content": reply})
+        _drop_speculation(session_key)
+        
+        if response_id is None:
+            # The chain never took this turn's context message
+            _forget_session_context(session_key)
+        elif session_key != ANONYMOUS_SESSION:
+            conversation_store.set_last_response_id(session_key, response_id)
+        
+        # Keep history manageable (last 20 messages)
+        conversation_store.append(session_key, *turn)
+        conversation_store.trim(session_key, MAX_HISTORY_MESSAGES)
+        
+        if not tool_calls:
+            return {
+                "response": reply,
+                "intent": "conversation"
+            }
+        
+        for tool_call, result in zip(tool_calls, tool_results):
+            if tool_call.name in _TOOL_INTENTS and result.get("success"):
+                conversation_store.set_intent(session_key, _TOOL_INTENTS[tool_call.name])
+        
+        function_name = tool_calls[0].name
+        return {
+            "response": reply,
+            "intent": function_name.replace("create_", "").replace("get_", ""),
+            "toolResult": tool_results[0] if len(tool_results) == 1 else tool_results
+        }
+    
+    @staticmethod
+    def _previous_response_id(session_key: str) -> Optional[str]:
+        """The response this turn chains onto (the server keeps prior turns), if any."""
+        if session_key == ANONYMOUS_SESSION:
+            return None
+        return conversation_store.get_last_response_id(session_key)
+    
+    @staticmethod
+    def _canned_result(session_key: str, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Answer closing lines, and standalone FAQs outside an order/reservation
+        flow, without calling the LLM. Returns None when the LLM is needed.
+        """
+        if END_TRIGGER_RE.fullmatch(text):
+            # The call is over: a later call from this number starts a new chain
+            conversation_store.clear(session_key)
+            _forget_session_context(session_key)
+            return {
+                "response": GOODBYE_RESPONSE,
+                "intent": "goodbye"
+            }
+        
+        topic = faq_classify(text)
+        if topic is not None and conversation_store.get_intent(session_key) is None:
+            return {
+                "response": FAQ_RESPONSES[topic],
+                "intent": "faq"
+            }
+        return None
+    
+    @staticmethod
+    def _error_result(session_key: str, e: Exception) -> Dict[str, Any]:
+        logger.error(f"LLM agent error: {e}")
+        _drop_speculation(session_key)
+        # The chain did not advance, so it has not seen this turn's context either
+        _forget_session_context(session_key)
+        return {
+            "response": "I'm having trouble right now. Please try again or call the restaurant directly.",
+            "intent": "error",
+            "error": str(e)
+        }
+    
     def handle_message(self, text: str, customer_phone: Optional[str] = None) -> Dict[str, Any]:
         """
         Handle incoming message with LLM.
@@ -444,131 +973,206 @@ class LLMAgent:
               "data": {...}  # optional structured data
             }
         """
-        session_key = customer_phone or "anonymous"
-        
-        # Get or create conversation history
-        if session_key not in conversation_history:
-            conversation_history[session_key] = []
-        
-        history = conversation_history[session_key]
-        
-        # # # Build system prompt with dynamic variables
-        current_time = datetime.now().strftime("%B %d, %Y %I:%M %p")
-        system_prompt = SYSTEM_PROMPT.replace("{{current_datetime}}", current_time)
-        phone_display = format_phone_display(session_key)
-        system_prompt = system_prompt.replace("{{session_id}}", phone_display)
-        system_prompt = system_prompt.replace("{{restaurant_name}}", RESTAURANT_CONFIG["name"])
-        system_prompt = system_prompt.replace("{{restaurant_address}}", RESTAURANT_CONFIG["address"])
-
-        # Convert hours dict to string or use a simple message
-        hours_text = "Open 24 hours, 7 days a week"  # White Palace Grill is 24/7
-        system_prompt = system_prompt.replace("{{restaurant_hours}}", hours_text)
-
-        # Replace other placeholders with empty or default values if not used
-        system_prompt = system_prompt.replace("{{restaurant_timezone}}", RESTAURANT_CONFIG.get("timezone", "America/Chicago"))
-        system_prompt = system_prompt.replace("{{conversation_history}}", "")
-        system_prompt = system_prompt.replace("{{current_intent}}", "")
-        system_prompt = system_prompt.replace("{{current_step}}", "")
-
-        # Build messages
-        messages = [
-            {"role": "system", "content": system_prompt},
-            *history,
-            {"role": "user", "content": text}
-        ]
+        session_key = customer_phone or ANONYMOUS_SESSION
+        canned = self._canned_result(session_key, text)
+        if canned is not None:
+            return canned
+        
+        # The server keeps prior turns; we only send the new input
+        previous_response_id = self._previous_response_id(session_key)
+        system_prompt, context_items, prompt_cache_key = self._build_system_prompt(
+            session_key, text, previous_response_id
+        )
         
         try:
+            # One user message dict serves both the request input and the transcript
+            user_msg = {"role": "user", "content": text}
+            request = self._request(system_prompt, prompt_cache_key, [*context_items, user_msg],
+                                    previous_response_id, 80)
+            
             # Call OpenAI
-            response = get_openai_client().chat.completions.create(
-                model=self.model,
-                messages=messages,
-                tools=TOOLS,
-                temperature=self.temperature,
-                max_tokens=80
+            response = get_openai_client().responses.create(**request)
+            
+            tool_calls = [item for item in response.output if item.type == "function_call"]
+            
+            # Messages produced this turn, kept as a chat-format transcript
+            turn = [user_msg]
+            
+            # If LLM just responds with text
+            if not tool_calls:
+                return self._finish_turn(session_key, turn, response.id, response.output_text)
+            
+            # Execute tools (concurrently when the LLM asked for several)
+            tool_results = execute_tool_calls(tool_calls, customer_phone)
+            tool_inputs = self._record_tool_results(turn, tool_calls, tool_results)
+            
+            # Call LLM again with just the tool outputs to generate final response
+            request.update(input=tool_inputs, previous_response_id=response.id, max_output_tokens=500)
+            final_response = get_openai_client().responses.create(**request)
+            
+            return self._finish_turn(
+                session_key, turn, final_response.id, final_response.output_text,
+                tool_calls, tool_results
             )
+        
+        except Exception as e:
+            return self._error_result(session_key, e)
+    
+    def _stream_response(self, request: Dict[str, Any], chunks: List[str]) -> Iterator[str]:
+        """
+        Stream one Responses API call, yielding text deltas as they arrive.
+        
+        Deltas are also collected into `chunks`. The finished response is
+        returned as the generator's value; a response cut short at
+        max_output_tokens (incomplete) is returned as well, so the turn ends
+        on the text already spoken.
+        
+        A response that fails (or a stream that breaks) after text has been
+        yielded returns None; before any text it raises, so the caller can
+        apologise instead of trailing off mid-sentence.
+        """
+        finished = None
+        error = None
+        try:
+            stream = get_openai_client().responses.create(**request, stream=True)
+            for event in stream:
+                if event.type == "response.output_text.delta":
+                    chunks.append(event.delta)
+                    yield event.delta
+                elif event.type in ("response.completed", "response.incomplete"):
+                    finished = event.response
+                elif event.type == "response.failed":
+                    error = event.response.error.message if event.response.error else "response failed"
+                elif event.type == "error":
+                    error = event.message
+        except Exception as e:
+            if not chunks:
+                raise
+            error = str(e)
+        
+        if finished is None:
+            error = error or "stream ended without a response"
+            if not chunks:
+                raise RuntimeError(f"OpenAI response failed: {error}")
+            logger.warning(f"LLM stream broke off after partial text: {error}")
+        return finished
+    
+    def stream_message(self, text: str, customer_phone: Optional[str] = None) -> Iterator[str]:
+        """
+        Streaming variant of handle_message for voice/TTS consumers.
+        
+        Yields reply text as soon as tokens arrive instead of waiting for the
+        whole generation; history is persisted once the reply is complete.
+        """
+        session_key = customer_phone or ANONYMOUS_SESSION
+        canned = self._canned_result(session_key, text)
+        if canned is not None:
+            yield canned["response"]
+            return
+        
+        previous_response_id = self._previous_response_id(session_key)
+        system_prompt, context_items, prompt_cache_key = self._build_system_prompt(
+            session_key, text, previous_response_id
+        )
+        
+        try:
+            chunks: List[str] = []
+            user_msg = {"role": "user", "content": text}
+            request = self._request(system_prompt, prompt_cache_key, [*context_items, user_msg],
+                                    previous_response_id, 80)
+            response = yield from self._stream_response(request, chunks)
+            
+            # A cut-short response may hold a half-written call; only act on finished ones
+            tool_calls = []
+            if response is not None and response.status == "completed":
+                tool_calls = [item for item in response.output if item.type == "function_call"]
+            turn = [user_msg]
+            
+            if not tool_calls:
+                self._finish_turn(session_key, turn, response and response.id, "".join(chunks))
+                return
             
-            message = response.choices[0].message
+            # Give TTS something to say right away instead of silence while
+            # the tools and the follow-up call run
+            filler = TOOL_FILLERS.get(tool_calls[0].name)
+            if filler and not chunks:
+                yield filler + " "
             
-            # Save user message to history
-            history.append({"role": "user", "content": text})
+            tool_results = execute_tool_calls(tool_calls, customer_phone)
+            tool_inputs = self._record_tool_results(turn, tool_calls, tool_results)
             
-            # If LLM wants to call a tool
-            if message.tool_calls:
-                tool_call = message.tool_calls[0]
-                function_name = tool_call.function.name
-                arguments = json.loads(tool_call.function.arguments)
-                
-                logger.info(f"LLM calling tool: {function_name} with args: {arguments}")
-                
-                # Execute tool
-                if function_name == "get_menu_items":
-                    tool_result = tool_get_menu_items(**arguments)
-                elif function_name == "create_order":
-                    arguments["customerPhone"] = customer_phone or ""
-                    tool_result = tool_create_order(**arguments)
-                elif function_name == "create_reservation":
-                    arguments["customerPhone"] = customer_phone or ""
-                    tool_result = tool_create_reservation(**arguments)
-                elif function_name == "check_reservation_availability":
-                    tool_result = tool_check_reservation_availability(**arguments)
-                else:
-                    tool_result = {"error": "Unknown tool"}
-                
-                # Add tool call and result to history
-                history.append(message.model_dump())
-                history.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "name": function_name,
-                    "content": json.dumps(tool_result)
-                })
-                
-                # Call LLM again to generate final response
-                final_response = get_openai_client().chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        *history
-                    ],
-                    temperature=self.temperature,
-                    max_tokens=500
+            # Start speaking the final answer at its first token
+            chunks = []
+            request.update(input=tool_inputs, previous_response_id=response.id, max_output_tokens=500)
+            final_response = yield from self._stream_response(request, chunks)
+            
+            self._finish_turn(
+                session_key, turn, final_response and final_response.id, "".join(chunks),
+                tool_calls, tool_results
+            )
+        
+        except Exception as e:
+            error_reply = self._error_result(session_key, e)["response"]
+            # Text already spoken stands on its own; an apology after it would cut in mid-reply
+            if not chunks:
+                yield error_reply
+    
+    async def handle_message_async(self, text: str, customer_phone: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Async variant of handle_message.
+        
+        OpenAI calls go through AsyncOpenAI and blocking tool/DB work runs in
+        worker threads, so one worker can serve many sessions while IO is in flight.
+        Meant to run on llm_executor's loop, which caps concurrent OpenAI calls
+        and their rate across every session. Conversation-store reads and
+        writes (Redis) also run in worker threads, so a slow store cannot
+        stall the other sessions on that loop.
+        """
+        session_key = customer_phone or ANONYMOUS_SESSION
+        canned = await asyncio.to_thread(self._canned_result, session_key, text)
+        if canned is not None:
+            return canned
+        
+        previous_response_id = await asyncio.to_thread(self._previous_response_id, session_key)
+        system_prompt, context_items, prompt_cache_key = await asyncio.to_thread(
+            self._build_system_prompt, session_key, text, previous_response_id
+        )
+        
+        try:
+            client = get_async_openai_client()
+            user_msg = {"role": "user", "content": text}
+            request = self._request(system_prompt, prompt_cache_key, [*context_items, user_msg],
+                                    previous_response_id, 80)
+            async with llm_executor.limit():
+                response = await client.responses.create(**request)
+            
+            tool_calls = [item for item in response.output if item.type == "function_call"]
+            turn = [user_msg]
+            
+            if not tool_calls:
+                return await asyncio.to_thread(
+                    self._finish_turn, session_key, turn, response.id, response.output_text
                 )
-                
-                final_message = final_response.choices[0].message.content
-                history.append({"role": "assistant", "content": final_message})
-                
-                # Keep history manageable (last 20 messages)
-                if len(history) > 20:
-                    history = history[-20:]
-                conversation_history[session_key] = history
-                
-                return {
-                    "response": final_message,
-                    "intent": function_name.replace("create_", "").replace("get_", ""),
-                    "toolResult": tool_result
-                }
             
-            # If LLM just responds with text
-            else:
-                assistant_reply = message.content
-                history.append({"role": "assistant", "content": assistant_reply})
-                
-                if len(history) > 20:
-                    history = history[-20:]
-                conversation_history[session_key] = history
-                
-                return {
-                    "response": assistant_reply,
-                    "intent": "conversation"
-                }
+            tool_results = await execute_tool_calls_async(tool_calls, customer_phone)
+            tool_inputs = self._record_tool_results(turn, tool_calls, tool_results)
+            
+            request.update(input=tool_inputs, previous_response_id=response.id, max_output_tokens=500)
+            async with llm_executor.limit():
+                final_response = await client.responses.create(**request)
+            
+            return await asyncio.to_thread(
+                self._finish_turn, session_key, turn, final_response.id, final_response.output_text,
+                tool_calls, tool_results
+            )
         
         except Exception as e:
-            logger.error(f"LLM agent error: {e}")
-            return {
-                "response": "I'm having trouble right now. Please try again or call the restaurant directly.",
-                "intent": "error",
-                "error": str(e)
-            }
+            return self._error_result(session_key, e)
+    
+    def handle_message_shared(self, text: str, customer_phone: Optional[str] = None,
+                              timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Run handle_message_async on the shared executor loop from a sync caller"""
+        return llm_executor.run(self.handle_message_async(text, customer_phone), timeout)
 
 
 # ============================================================================
@@ -3,35 +3,32 @@ White Palace Grill - AI Voice Agent Backend
 Flask application with LiveKit + Twilio integration
 """
 
-import eventlet
-eventlet.monkey_patch()
-
-from flask import Flask, jsonify
-from flask import g
+from flask import Flask, jsonify, send_file
 from flask_cors import CORS
+from flask_compress import Compress
 from flask_socketio import SocketIO, emit
 from dotenv import load_dotenv
 import os
+import time
+import tempfile
+import threading
+import importlib
+import orjson
 import logging
-from datetime import datetime, timezone
 
 # Load environment variables
 load_dotenv()
 
 # Import configurations and utilities
-from config.database import init_db
+from config.database import init_db, get_db_cursor
 from config.restaurant_config import RESTAURANT_CONFIG
-from config.constants import HTTP_STATUS, ERROR_MESSAGES
-from middleware.error_handler import error_handler
-from routes.menu import menu_bp
-from routes.orders import orders_bp
-from routes.reservations import reservations_bp
-from routes.payments import payments_bp
-from routes.voice import voice_bp
-from routes.twilio_webhooks import twilio_bp
-from routes.agent import agent_bp
-from routes.admin_auth import admin_bp
-from routes.customer_auth import customer_bp
+from config.constants import (
+    HTTP_OK, HTTP_NOT_FOUND, HTTP_INTERNAL_SERVER_ERROR, HTTP_SERVICE_UNAVAILABLE
+)
+from utils.helpers import iso_now
+from utils.cache import response_cache, response_cache_config
+from utils.json_provider import ORJSONProvider
+from middleware.error_handler import error_handler, prebuilt_json_response
 from utils.websocket_service import init_socketio, register_socketio_events
 
 # Configure logging
@@ -43,6 +40,18 @@ logger = logging.getLogger(__name__)
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
+
+# Compress JSON bodies (Brotli when the client accepts it, else gzip)
+app.config['COMPRESS_MIMETYPES'] = ['application/json']
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_LEVEL'] = 5
+app.config['COMPRESS_BR_LEVEL'] = 5
+app.config['COMPRESS_MIN_SIZE'] = 512
+Compress(app)
+
+# Cache read-heavy GET responses (menu) across workers when Redis is available
+response_cache.init_app(app, config=response_cache_config())
 app.config['JSON_SORT_KEYS'] = False
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
 
@@ -66,100 +75,135 @@ CORS(app, resources={
     }
 })
 
-# Register blueprints (routes)
-app.register_blueprint(menu_bp, url_prefix='/api/menu')
-app.register_blueprint(orders_bp, url_prefix='/api/orders')
-app.register_blueprint(reservations_bp, url_prefix='/api/reservations')
-app.register_blueprint(payments_bp, url_prefix='/api/payments')
-app.register_blueprint(voice_bp, url_prefix='/api/voice')
-app.register_blueprint(twilio_bp, url_prefix='/api/twilio')
-app.register_blueprint(agent_bp, url_prefix="/api/agent")
-app.register_blueprint(admin_bp, url_prefix="/api/admin")
-app.register_blueprint(customer_bp, url_prefix="/api/customer")
+# Register blueprints (routes): (module, blueprint name, URL prefix)
+BLUEPRINTS = (
+    ('routes.menu', 'menu_bp', '/api/menu'),
+    ('routes.orders', 'orders_bp', '/api/orders'),
+    ('routes.reservations', 'reservations_bp', '/api/reservations'),
+    ('routes.payments', 'payments_bp', '/api/payments'),
+    ('routes.voice', 'voice_bp', '/api/voice'),
+    ('routes.twilio_webhooks', 'twilio_bp', '/api/twilio'),
+    ('routes.agent', 'agent_bp', '/api/agent'),
+    ('routes.admin_auth', 'admin_bp', '/api/admin'),
+    ('routes.customer_auth', 'customer_bp', '/api/customer'),
+)
+
+for module_name, bp_name, url_prefix in BLUEPRINTS:
+    blueprint = getattr(importlib.import_module(module_name), bp_name)
+    app.register_blueprint(blueprint, url_prefix=url_prefix)
 
 
 
 # Health check endpoint
+# (second, result) of the last database probe; the lock makes concurrent
+# checks in a new second wait for one probe instead of each running their own
+_database_probe = (None, False)
+_database_probe_lock = threading.Lock()
+
+
+def _database_ok(second):
+    """Probe the database; health checks within the same second share the result"""
+    global _database_probe
+    with _database_probe_lock:
+        probed_at, ok = _database_probe
+        if probed_at == second:
+            return ok
+        try:
+            with get_db_cursor() as cursor:
+                cursor.execute('SELECT 1')
+            ok = True
+        except Exception as e:
+            logger.error(f'Health check failed: {str(e)}')
+            ok = False
+        _database_probe = (second, ok)
+        return ok
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    try:
-        from config.database import get_db_cursor
-        with get_db_cursor() as cursor:
-            cursor.execute('SELECT NOW()')
-        
+    if _database_ok(int(time.time())):
         return jsonify({
             'status': 'OK',
             'restaurant': RESTAURANT_CONFIG['name'],
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': iso_now(),
             'version': '1.0.0',
             'database': 'connected'
-        }), HTTP_STATUS['OK']
-    except Exception as e:
-        logger.error(f'Health check failed: {str(e)}')
-        return jsonify({
-            'status': 'ERROR',
-            'message': 'Database connection failed',
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }), HTTP_STATUS['SERVICE_UNAVAILABLE']
+        }), HTTP_OK
+
+    return _database_down_response()
+
+_database_down_response = prebuilt_json_response(
+    {'status': 'ERROR', 'message': 'Database connection failed'}, HTTP_SERVICE_UNAVAILABLE
+)
+
+# Restaurant info is static, so its JSON body is serialized once at import
+RESTAURANT_JSON = orjson.dumps({
+    'id': RESTAURANT_CONFIG['id'],
+    'name': RESTAURANT_CONFIG['name'],
+    'phone': RESTAURANT_CONFIG['phone'],
+    'address': RESTAURANT_CONFIG['address'],
+    'city': RESTAURANT_CONFIG['city'],
+    'state': RESTAURANT_CONFIG['state'],
+    'zipCode': RESTAURANT_CONFIG['zip_code'],
+    'email': RESTAURANT_CONFIG['email'],
+    'website': RESTAURANT_CONFIG['website'],
+    'established': RESTAURANT_CONFIG['established_year'],
+    'hours': RESTAURANT_CONFIG['hours'],
+    'services': RESTAURANT_CONFIG['services'],
+    'timezone': RESTAURANT_CONFIG['timezone']
+})
+
+# Written to disk once so send_file can hand the file to the server (sendfile)
+# and answer If-None-Match / If-Modified-Since with 304s
+RESTAURANT_JSON_PATH = os.path.join(tempfile.gettempdir(), 'white_palace_restaurant.json')
+STARTUP_TIME = time.time()
+
+def _write_static_json(path, body):
+    """Atomically write a pre-serialized JSON body (safe with several workers)"""
+    tmp_path = f'{path}.{os.getpid()}'
+    with open(tmp_path, 'wb') as f:
+        f.write(body)
+    os.replace(tmp_path, path)
+
+_write_static_json(RESTAURANT_JSON_PATH, RESTAURANT_JSON)
 
 # Restaurant info endpoint
 @app.route('/api/restaurant', methods=['GET'])
 def get_restaurant():
     """Get restaurant information"""
-    return jsonify({
-        'id': RESTAURANT_CONFIG['id'],
-        'name': RESTAURANT_CONFIG['name'],
-        'phone': RESTAURANT_CONFIG['phone'],
-        'address': RESTAURANT_CONFIG['address'],
-        'city': RESTAURANT_CONFIG['city'],
-        'state': RESTAURANT_CONFIG['state'],
-        'zipCode': RESTAURANT_CONFIG['zip_code'],
-        'email': RESTAURANT_CONFIG['email'],
-        'website': RESTAURANT_CONFIG['website'],
-        'established': RESTAURANT_CONFIG['established_year'],
-        'hours': RESTAURANT_CONFIG['hours'],
-        'services': RESTAURANT_CONFIG['services'],
-        'timezone': RESTAURANT_CONFIG['timezone']
-    }), HTTP_STATUS['OK']
+    return send_file(
+        RESTAURANT_JSON_PATH,
+        mimetype='application/json',
+        conditional=True,
+        etag=True,
+        last_modified=STARTUP_TIME,
+        max_age=3600
+    )
+
+# Error bodies are fixed, so they are serialized once; only the timestamp varies
+_not_found_response = prebuilt_json_response(
+    {'error': 'Not Found', 'message': 'The requested resource does not exist'}, HTTP_NOT_FOUND
+)
+_internal_error_response = prebuilt_json_response(
+    {'error': 'Internal Server Error', 'message': 'An unexpected error occurred'}, HTTP_INTERNAL_SERVER_ERROR
+)
 
 # 404 handler
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({
-        'error': 'Not Found',
-        'message': 'The requested resource does not exist',
-        'timestamp': datetime.now(timezone.utc).isoformat()
-    }), HTTP_STATUS['NOT_FOUND']
+    return _not_found_response()
 
 # 500 handler
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
     logger.error(f'Internal server error: {str(error)}')
-    return jsonify({
-        'error': 'Internal Server Error',
-        'message': 'An unexpected error occurred',
-        'timestamp': datetime.now(timezone.utc).isoformat()
-    }), HTTP_STATUS['INTERNAL_SERVER_ERROR']
+    return _internal_error_response()
 
 # Register error handler middleware
 app.register_error_handler(Exception, error_handler)
 
-# Initialize database on startup
-@app.before_request
-def before_request():
-    """Initialize database connection before each request"""
-    pass
-
-@app.teardown_appcontext
-def close_connection(exception):
-    """Close database connection after each request"""
-    db = getattr(g, '_database', None)
-    if db is not None:
-        db.close()
-
 if __name__ == '__main__':
     # Initialize database
     init_db()
@@ -180,10 +224,10 @@ if __name__ == '__main__':
     
     logger.info(f'Health check: http://localhost:{port}/api/health')
     logger.info(f'Restaurant info: http://localhost:{port}/api/restaurant')
-    # close_connection()
     socketio.run(
         app,
         host='0.0.0.0',
         port=port,
-        debug=debug
+        debug=debug,
+        allow_unsafe_werkzeug=True  # dev server; production runs under gunicorn
     )
@@ -0,0 +1,41 @@
+"""
+White Palace Grill - Speech-to-text fixups
+
+Known STT mishearings of menu words are corrected before a transcript
+reaches the agent, so neither the LLM nor the intent classifier has to
+guess at them.
+"""
+
+import re
+from types import MappingProxyType
+
+# Misheard phrase (lowercase) -> intended phrase
+FIXUPS = MappingProxyType({
+    "baragun": "burger",
+    "burgur": "burger",
+    "fry's": "fries",
+    "frys": "fries",
+    "home freeze": "home fries",
+    "chilly": "chili",
+    "hash brown's": "hash browns",
+    "pan cakes": "pancakes",
+    "milk shake": "milkshake",
+    "omelet": "omelette",
+    "reservashun": "reservation",
+})
+
+# One alternation over every phrase, longest first so multi-word fixups win;
+# a single scan of the utterance finds all of them
+_FIXUP_RE = re.compile(
+    r"\b(?:" + "|".join(re.escape(p) for p in sorted(FIXUPS, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE
+)
+
+
+def _fixup(match: re.Match) -> str:
+    return FIXUPS[match.group(0).lower()]
+
+
+def normalize(utterance: str) -> str:
+    """Return the utterance with known mishearings replaced"""
+    return _FIXUP_RE.sub(_fixup, utterance)
@@ -1,9 +1,13 @@
 """
 Constants and enumerations for the application
+Tables are read-only MappingProxyType views (nested sequences are tuples);
+writes raise TypeError
 """
 
+from types import MappingProxyType
+
 # HTTP Status Codes
-HTTP_STATUS = {
+HTTP_STATUS = MappingProxyType({
     'OK': 200,
     'CREATED': 201,
     'BAD_REQUEST': 400,
@@ -13,10 +17,18 @@ HTTP_STATUS = {
     'CONFLICT': 409,
     'INTERNAL_SERVER_ERROR': 500,
     'SERVICE_UNAVAILABLE': 503
-}
+})
+
+# Direct names for the hottest statuses (a global load instead of a dict lookup)
+HTTP_OK = HTTP_STATUS['OK']
+HTTP_CREATED = HTTP_STATUS['CREATED']
+HTTP_BAD_REQUEST = HTTP_STATUS['BAD_REQUEST']
+HTTP_NOT_FOUND = HTTP_STATUS['NOT_FOUND']
+HTTP_INTERNAL_SERVER_ERROR = HTTP_STATUS['INTERNAL_SERVER_ERROR']
+HTTP_SERVICE_UNAVAILABLE = HTTP_STATUS['SERVICE_UNAVAILABLE']
 
 # Error Messages
-ERROR_MESSAGES = {
+ERROR_MESSAGES = MappingProxyType({
     # General
     'INTERNAL_ERROR': 'Internal server error',
     'NOT_FOUND': 'Resource not found',
@@ -48,18 +60,18 @@ ERROR_MESSAGES = {
     'LIVEKIT_ERROR': 'LiveKit connection error',
     'INVALID_ROOM': 'Invalid room name',
     'MISSING_TOKEN': 'Missing access token'
-}
+})
 
 # Success Messages
-SUCCESS_MESSAGES = {
+SUCCESS_MESSAGES = MappingProxyType({
     'MENU_ITEMS_FETCHED': 'Menu items fetched successfully',
     'ORDER_CREATED': 'Order created successfully',
     'RESERVATION_CREATED': 'Reservation created successfully',
     'ROOM_CREATED': 'LiveKit room created successfully'
-}
+})
 
 # Intent Types (for voice processing)
-INTENT_TYPES = {
+INTENT_TYPES = MappingProxyType({
     'PLACE_ORDER': 'place_order',
     'MAKE_RESERVATION': 'make_reservation',
     'QUERY_MENU': 'query_menu',
@@ -69,20 +81,20 @@ INTENT_TYPES = {
     'CANCEL_ORDER': 'cancel_order',
     'CANCEL_RESERVATION': 'cancel_reservation',
     'UNKNOWN': 'unknown'
-}
+})
 
 # Order Status
-ORDER_STATUS = {
+ORDER_STATUS = MappingProxyType({
     'PENDING': 'pending',
     'CONFIRMED': 'confirmed',
     'PREPARING': 'preparing',
     'READY': 'ready',
     'COMPLETED': 'completed',
     'CANCELLED': 'cancelled'
-}
+})
 
 # Reservation Status
-RESERVATION_STATUS = {
+RESERVATION_STATUS = MappingProxyType({
     'PENDING': 'pending',
     'CONFIRMED': 'confirmed',
     'ARRIVED': 'arrived',
@@ -90,29 +102,29 @@ RESERVATION_STATUS = {
     'COMPLETED': 'completed',
     'CANCELLED': 'cancelled',
     'NO_SHOW': 'no_show'
-}
+})
 
 # Default values
-DEFAULTS = {
+DEFAULTS = MappingProxyType({
     'ITEMS_PER_PAGE': 50,
     'QUERY_TIMEOUT': 5000,  # milliseconds
     'MAX_RETRIES': 3,
     'CACHE_TTL': 300  # seconds
-}
+})
 
 # Twilio Message Templates
-TWILIO_MESSAGES = {
+TWILIO_MESSAGES = MappingProxyType({
     'ORDER_CONFIRMATION': 'Your order #{order_id} has been confirmed. Estimated ready time: {ready_time}. Thank you!',
     'ORDER_READY': 'Your order #{order_id} is ready for {order_type}. Thank you for choosing White Palace Grill!',
     'RESERVATION_CONFIRMATION': 'Your reservation for {party_size} at {time} on {date} is confirmed. Reservation #{res_id}',
     'VOICE_CALL_GREETING': 'Welcome to White Palace Grill! How can we help you today?'
-}
+})
 
 # LiveKit configuration
-LIVEKIT_CONFIG = {
+LIVEKIT_CONFIG = MappingProxyType({
     'GRANT_CAN_PUBLISH': True,
     'GRANT_CAN_PUBLISH_DATA': True,
     'GRANT_CAN_SUBSCRIBE': True,
-    'GRANT_CAN_PUBLISH_SOURCES': ['microphone', 'screen_share'],
+    'GRANT_CAN_PUBLISH_SOURCES': ('microphone', 'screen_share'),
     'GRANT_INGEST': False
-}
+})
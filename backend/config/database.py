@@ -1,12 +1,13 @@
 """
 Database configuration and connection management
-PostgreSQL connection pool for White Palace Grill
+PostgreSQL connection pool for White Palace Grill (psycopg 3)
 """
 
-import psycopg2
-from psycopg2.pool import ThreadedConnectionPool
-from psycopg2.extras import RealDictCursor
+from psycopg.rows import dict_row
+from psycopg_pool import ConnectionPool
 import os
+import time
+import weakref
 import logging
 from contextlib import contextmanager
 
@@ -26,23 +27,75 @@ else:
         'password': os.getenv('DB_PASSWORD', 'password')
     }
 
+# Fail fast when Postgres is unreachable; voice turns can't wait out the OS default
+CONNECT_TIMEOUT = int(os.getenv('DB_CONNECT_TIMEOUT', 3))
+
+# Keep a few connections warm so requests skip the cold-connect cost
+MIN_CONNECTIONS = int(os.getenv('DB_MIN_CONNECTIONS', 5))
+MAX_CONNECTIONS = int(os.getenv('DB_MAX_CONNECTIONS', 40))
+
+# How long a request waits for a free pooled connection before failing
+POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 10))
+
+# Pooled connections are pinged before reuse at most once per interval
+PRE_PING_INTERVAL = float(os.getenv('DB_PRE_PING_INTERVAL', 30))
+_last_pinged = weakref.WeakKeyDictionary()
+
+# Hot statements run through execute_prepared(); psycopg prepares them
+# server-side on first use per connection so Postgres skips parse/plan after
+PREPARED_STATEMENTS = {
+    'reservation_conflicts': """
+        SELECT COUNT(*) AS conflict_count
+        FROM reservations
+        WHERE restaurant_id = %s
+        AND reservation_date = %s
+        AND status = ANY(%s)
+        AND ABS(EXTRACT(EPOCH FROM (reservation_time - %s::time))) < 5400
+    """,
+}
+
+def _check_connection(conn):
+    """
+    Pool check callback: replace connections that died while idle
+    The SELECT 1 probe runs at most once per PRE_PING_INTERVAL per connection
+    """
+    now = time.monotonic()
+    last_pinged = _last_pinged.get(conn)
+    if last_pinged is not None and now - last_pinged < PRE_PING_INTERVAL:
+        return
+
+    ConnectionPool.check_connection(conn)
+    _last_pinged[conn] = now
+
 # Create connection pool
+# Checkouts wait up to POOL_TIMEOUT when every connection is busy, and broken
+# connections are discarded on return instead of being recycled
 try:
     if DATABASE_URL:
-        connection_pool = ThreadedConnectionPool(
-            minconn=1,
-            maxconn=50, # Increased for production
-            dsn=DATABASE_URL
+        connection_pool = ConnectionPool(
+            conninfo=DATABASE_URL,
+            kwargs={'connect_timeout': CONNECT_TIMEOUT},
+            min_size=MIN_CONNECTIONS,
+            max_size=MAX_CONNECTIONS,
+            timeout=POOL_TIMEOUT,
+            check=_check_connection,
+            name='white_palace'
         )
     else:
-        connection_pool = ThreadedConnectionPool(
-            minconn=1,
-            maxconn=50, # Increased for production
-            host=DB_CONFIG['host'],
-            port=DB_CONFIG['port'],
-            database=DB_CONFIG['database'],
-            user=DB_CONFIG['user'],
-            password=DB_CONFIG['password']
+        connection_pool = ConnectionPool(
+            kwargs={
+                'host': DB_CONFIG['host'],
+                'port': DB_CONFIG['port'],
+                'dbname': DB_CONFIG['database'],
+                'user': DB_CONFIG['user'],
+                'password': DB_CONFIG['password'],
+                'connect_timeout': CONNECT_TIMEOUT
+            },
+            min_size=MIN_CONNECTIONS,
+            max_size=MAX_CONNECTIONS,
+            timeout=POOL_TIMEOUT,
+            check=_check_connection,
+            name='white_palace'
         )
     logger.info('✅ Database connection pool created')
 except Exception as e:
@@ -50,63 +103,63 @@ except Exception as e:
     connection_pool = None
 
 def init_db():
-    """Initialize database connection and test it"""
+    """
+    Initialize database connections and test them
+    Waits until min_size connections are open (connect + auth) so the first
+    requests after startup don't pay for it
+    """
     try:
-        conn = connection_pool.getconn()
-        cursor = conn.cursor()
-        cursor.execute('SELECT NOW()')
-        result = cursor.fetchone()
-        cursor.close()
-        connection_pool.putconn(conn)
-        logger.info(f'✅ Database connection successful at {result}')
+        connection_pool.wait(timeout=POOL_TIMEOUT)
+        with connection_pool.connection() as conn:
+            result = conn.execute('SELECT NOW()').fetchone()
+        logger.info(f'✅ Database connection successful at {result} ({connection_pool.min_size} connections warmed)')
         return True
     except Exception as e:
         logger.error(f'❌ Database connection failed: {str(e)}')
         raise
 
 @contextmanager
-def get_db_cursor(dict_cursor=False):
+def get_db_cursor(dict_cursor=False, pipeline=False):
     """
     Context manager for database cursor
+    Commits on success, rolls back on error, and always returns the connection
     Usage:
         with get_db_cursor() as cursor:
             cursor.execute(...)
+
+    Args:
+        dict_cursor: Rows as dicts instead of tuples
+        pipeline: Send statements in pipeline mode (one flush for several queries)
     """
-    conn = connection_pool.getconn()
-    cursor = None
     try:
-        if dict_cursor:
-            cursor = conn.cursor(cursor_factory=RealDictCursor)
-        else:
-            cursor = conn.cursor()
-        yield cursor
-        conn.commit()
+        with connection_pool.connection() as conn:
+            with conn.cursor(row_factory=dict_row if dict_cursor else None) as cursor:
+                if pipeline:
+                    with conn.pipeline():
+                        yield cursor
+                else:
+                    yield cursor
     except Exception as e:
-        conn.rollback()
         logger.error(f'Database error: {str(e)}')
         raise
-    finally:
-        if cursor:
-            cursor.close()
-        connection_pool.putconn(conn)
 
 def execute_query(sql, params=None, fetch_one=False, fetch_all=True):
     """
     Execute a SQL query and return results
-    
+
     Args:
         sql: SQL query string
         params: Query parameters (tuple or dict)
         fetch_one: Return single row
         fetch_all: Return all rows
-    
+
     Returns:
         Query result(s)
     """
     try:
         with get_db_cursor(dict_cursor=True) as cursor:
             cursor.execute(sql, params)
-            
+
             if fetch_one:
                 return cursor.fetchone()
             elif fetch_all:
@@ -117,10 +170,73 @@ def execute_query(sql, params=None, fetch_one=False, fetch_all=True):
         logger.error(f'Query execution error: {str(e)}')
         raise
 
+def execute_queries(*queries):
+    """
+    Run several read queries in one pipeline (a single network roundtrip)
+
+    Args:
+        queries: (sql, params) pairs
+
+    Returns:
+        List with each query's rows (as dicts), in order
+    """
+    try:
+        with connection_pool.connection() as conn:
+            with conn.pipeline():
+                cursors = [
+                    conn.cursor(row_factory=dict_row).execute(sql, params)
+                    for sql, params in queries
+                ]
+            return [cursor.fetchall() for cursor in cursors]
+    except Exception as e:
+        logger.error(f'Query execution error: {str(e)}')
+        raise
+
+def execute_many_query(sql, rows):
+    """
+    Insert/update many rows with one pipelined executemany
+
+    Args:
+        sql: Single-row statement, e.g. 'INSERT INTO t (a, b) VALUES (%s, %s)'
+        rows: Sequence of row tuples
+
+    Returns:
+        Number of rows affected
+    """
+    try:
+        with get_db_cursor() as cursor:
+            cursor.executemany(sql, rows)
+            return cursor.rowcount
+    except Exception as e:
+        logger.error(f'Batch execution error: {str(e)}')
+        raise
+
+def execute_prepared(name, params=None, fetch_one=False, fetch_all=True):
+    """
+    Execute one of PREPARED_STATEMENTS by name (same return contract as execute_query)
+
+    Args:
+        name: Key in PREPARED_STATEMENTS
+        params: Positional parameters (tuple)
+        fetch_one: Return single row
+        fetch_all: Return all rows
+    """
+    try:
+        with get_db_cursor(dict_cursor=True) as cursor:
+            cursor.execute(PREPARED_STATEMENTS[name], params, prepare=True)
+
+            if fetch_one:
+                return cursor.fetchone()
+            elif fetch_all:
+                return cursor.fetchall()
+            else:
+                return cursor.rowcount
+    except Exception as e:
+        logger.error(f'Prepared statement {name} error: {str(e)}')
+        raise
+
 def close_db():
     """Close all connections in the pool"""
     if connection_pool:
-        connection_pool.closeall()
+        connection_pool.close()
         logger.info('Database pool closed')
-
-
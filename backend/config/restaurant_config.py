@@ -4,6 +4,9 @@ All restaurant-specific settings
 """
 
 import os
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
 RESTAURANT_CONFIG = {
     # Basic Information
     'id': 1,
@@ -88,6 +91,18 @@ RESTAURANT_CONFIG = {
     }
 }
 
+RESTAURANT_TZ = ZoneInfo(RESTAURANT_CONFIG['timezone'])
+
+def _parse_hhmm(value):
+    hours, minutes = value.split(':')
+    return time(int(hours), int(minutes))
+
+# Opening hours parsed once: {'monday': (open_time, close_time), ...}
+_HOURS_PARSED = {
+    day: (_parse_hhmm(hours['open']), _parse_hhmm(hours['close']))
+    for day, hours in RESTAURANT_CONFIG['hours'].items()
+}
+
 def is_restaurant_open(day_name=None):
     """
     Check if restaurant is currently open
@@ -98,21 +113,14 @@ def is_restaurant_open(day_name=None):
     Returns:
         Boolean indicating if restaurant is open
     """
-    from datetime import datetime
+    now = datetime.now(RESTAURANT_TZ)
     
     if not day_name:
-        day_name = datetime.now().strftime('%A').lower()
-    
-    day_hours = RESTAURANT_CONFIG['hours'].get(day_name)
+        day_name = now.strftime('%A').lower()
     
-    if not day_hours:
-        return False
+    open_time, close_time = _HOURS_PARSED.get(day_name, (None, None))
     
-    now = datetime.now().time()
-    open_time = datetime.strptime(day_hours['open'], '%H:%M').time()
-    close_time = datetime.strptime(day_hours['close'], '%H:%M').time()
-    
-    return open_time <= now < close_time
+    return open_time is not None and open_time <= now.time() < close_time
 
 def get_estimated_ready_time(prep_time=10, order_type='pickup'):
     """
@@ -125,8 +133,6 @@ def get_estimated_ready_time(prep_time=10, order_type='pickup'):
     Returns:
         datetime object with estimated ready time
     """
-    from datetime import datetime, timedelta
-    
     now = datetime.now()
     buffer = RESTAURANT_CONFIG['defaults']['estimated_delivery_time'] \
         if order_type == 'delivery' \
@@ -0,0 +1,91 @@
+"""
+White Palace Grill - Dialogue state machines
+
+Gates the voice agent's cancel tools in code instead of relying on the
+prompt: an order/reservation can only be cancelled after it was looked up
+(by the same number) during the call, and only once. Silence on the line is
+escalated the same way, without an LLM turn.
+"""
+
+from enum import Enum
+from typing import Dict, Optional, Tuple
+
+
+class CancelState(Enum):
+    ASK_NUMBER = 'ask_number'   # Nothing looked up yet (or the last lookup failed)
+    CONFIRM = 'confirm'         # Found; caller confirms before the cancel runs
+    DONE = 'done'               # Cancelled
+
+
+class CancelEvent(Enum):
+    LOOKUP_FOUND = 'lookup_found'
+    LOOKUP_MISSED = 'lookup_missed'
+    CANCELLED = 'cancelled'
+
+
+# (state, event) -> next state; pairs not listed leave the state unchanged
+TRANSITIONS: Dict[Tuple[CancelState, CancelEvent], CancelState] = {
+    (CancelState.ASK_NUMBER, CancelEvent.LOOKUP_FOUND): CancelState.CONFIRM,
+    (CancelState.CONFIRM, CancelEvent.LOOKUP_FOUND): CancelState.CONFIRM,
+    (CancelState.CONFIRM, CancelEvent.LOOKUP_MISSED): CancelState.ASK_NUMBER,
+    (CancelState.CONFIRM, CancelEvent.CANCELLED): CancelState.DONE,
+    (CancelState.DONE, CancelEvent.LOOKUP_FOUND): CancelState.CONFIRM,
+    (CancelState.DONE, CancelEvent.LOOKUP_MISSED): CancelState.ASK_NUMBER,
+}
+
+# Spoken back when the LLM tries to cancel out of order
+CANCEL_REFUSED = {
+    'success': False,
+    'error': 'Cancellation requires looking up and confirming the number first',
+    'description': "Before I cancel anything, let me look it up. Can you give me the number again?"
+}
+
+
+class CancellationFlow:
+    """Per-call cancellation state for one kind of record (orders or reservations)"""
+
+    def __init__(self):
+        self.state = CancelState.ASK_NUMBER
+        self.number: Optional[str] = None
+
+    def fire(self, event: CancelEvent, number: Optional[str] = None) -> CancelState:
+        """Apply an event and return the new state"""
+        self.state = TRANSITIONS.get((self.state, event), self.state)
+        if event is CancelEvent.LOOKUP_FOUND:
+            self.number = number
+        return self.state
+
+    def can_cancel(self, number: str) -> bool:
+        """True only when `number` is the record looked up and not yet cancelled"""
+        return self.state is CancelState.CONFIRM and number == self.number
+
+
+# Spoken on the 1st/2nd/3rd consecutive silence; the call ends after the 3rd
+SILENCE_MESSAGES = {
+    1: "Are you still there?",
+    2: "I'm having trouble hearing you. Are you still on the line?",
+    3: "I'm not getting a response, so I'll end the call now. Feel free to call us back at {phone}. Goodbye!",
+}
+MAX_SILENCE_STRIKES = len(SILENCE_MESSAGES)
+
+
+class SilenceStrikes:
+    """Per-call count of consecutive silence timeouts"""
+
+    def __init__(self, phone_speech: str):
+        self.count = 0
+        self.phone_speech = phone_speech
+
+    def strike(self) -> str:
+        """Count one more silence and return the line to say"""
+        self.count = min(self.count + 1, MAX_SILENCE_STRIKES)
+        return SILENCE_MESSAGES[self.count].format(phone=self.phone_speech)
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the final warning was given and the call should end"""
+        return self.count >= MAX_SILENCE_STRIKES
+
+    def reset(self):
+        """The caller spoke"""
+        self.count = 0
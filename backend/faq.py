@@ -0,0 +1,95 @@
+"""
+White Palace Grill - Canned FAQ answers
+
+Standalone questions with fixed answers (hours, location, parking, ...)
+are answered from FAQ_RESPONSES instead of an LLM call.
+"""
+
+import re
+from types import MappingProxyType
+from typing import Optional
+
+from config.restaurant_config import RESTAURANT_CONFIG
+from restaurant_info import HOURS_TEXT, RESTAURANT_ADDRESS_SPEECH
+
+FAQ_RESPONSES = MappingProxyType({
+    # Hours and address come from the same values the LLM prompt is given
+    "hours": f"We're {HOURS_TEXT.lower()}. Anything else I can help with?",
+    "location": (
+        f"We're located at {RESTAURANT_ADDRESS_SPEECH} in {RESTAURANT_CONFIG['city']}. "
+        "Anything else I can help with?"
+    ),
+    "parking": (
+        "There is street parking nearby and some paid lots in the area. "
+        "Parking availability can vary depending on the time of day. Anything else I can help with?"
+    ),
+    "allergies": (
+        "We have a variety of options. Please let me know your allergies or dietary preferences "
+        "when placing your order, and we'll do our best to accommodate you. Anything else I can help with?"
+    ),
+    "payment": (
+        "We accept cash, card, and digital payments. Anything else I can help with?"
+    ),
+    "menu": (
+        "We have burgers, sandwiches, breakfast items, salads, sides, and more. "
+        "What sounds good to you?"
+    ),
+    "delivery": (
+        "Yes, we offer delivery. You can place an order for delivery, and we'll provide payment options "
+        "during checkout. Anything else I can help with?"
+    ),
+})
+
+# Each pattern must match the whole utterance (a standalone question), so
+# anything carrying an order or reservation still goes to the agent
+_LEAD = r"\W*(?:(?:hi|hey|hello|ok(?:ay)?|so|and|also)\W+)*"
+_TAIL = r"(?:\W+(?:today|tonight|now|right now|please))*\W*"
+_FAQ_PATTERNS = tuple(
+    (topic, re.compile(_LEAD + question + _TAIL, re.IGNORECASE))
+    for topic, question in (
+        ("hours", r"(?:what (?:time|hours) (?:do|are) you (?:close|open)|when (?:are|do) you (?:open|close)"
+                  r"|what are your hours|are you (?:still )?open|how late are you open)"),
+        ("location", r"(?:where are you(?: guys)? located|where are you|what(?:'s| is) your address"
+                     r"|what(?:'s| is) the address)"),
+        ("parking", r"(?:do you have parking|is there parking|where can i park)"),
+        ("allergies", r"(?:do you have (?:gluten[- ]free|vegan|vegetarian|dairy[- ]free) options"
+                      r"|are you vegan[- ]friendly)"),
+        ("payment", r"(?:what (?:payment methods|forms of payment|kind of payment) do you (?:accept|take)"
+                    r"|do you (?:accept|take) (?:cards?|credit cards?|cash))"),
+        ("menu", r"(?:what(?:'s| is) on (?:the|your) menu|what do you (?:serve|have)|what items do you have)"),
+        ("delivery", r"(?:do you (?:guys )?(?:deliver|do delivery|offer delivery))"),
+    )
+)
+
+# Near-miss phrasings ("what are your opening hours"): a short utterance that
+# shares at least two keywords with one topic and none that start a flow
+_FAQ_KEYWORDS = (
+    ("hours", frozenset({"hours", "open", "opening", "close", "closing", "time"})),
+    ("location", frozenset({"where", "located", "location", "address", "directions"})),
+    ("parking", frozenset({"parking", "park", "lot", "lots", "garage", "street"})),
+    ("allergies", frozenset({"gluten", "vegan", "vegetarian", "dairy", "allergy", "allergies", "options"})),
+    ("payment", frozenset({"pay", "payment", "cash", "card", "cards", "credit", "accept"})),
+    ("menu", frozenset({"menu", "serve", "items", "dishes", "food"})),
+    ("delivery", frozenset({"deliver", "delivery", "delivering", "area"})),
+)
+_FLOW_WORDS = frozenset({
+    "order", "reserve", "reservation", "book", "table", "cancel", "want", "like", "get", "party"
+})
+MAX_KEYWORD_WORDS = 8
+_WORD = re.compile(r"[a-z]+")
+
+
+def faq_classify(utterance: str) -> Optional[str]:
+    """Return the FAQ_RESPONSES topic of a standalone FAQ question, or None"""
+    for topic, pattern in _FAQ_PATTERNS:
+        if pattern.fullmatch(utterance):
+            return topic
+
+    words = _WORD.findall(utterance.lower())
+    if len(words) > MAX_KEYWORD_WORDS or not _FLOW_WORDS.isdisjoint(words):
+        return None
+    words = frozenset(words)
+    for topic, keywords in _FAQ_KEYWORDS:
+        if len(keywords & words) >= 2:
+            return topic
+    return None
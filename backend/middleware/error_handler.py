@@ -2,14 +2,43 @@
 Error handling middleware for Flask application
 """
 
-from flask import jsonify
+from flask import Response, jsonify
 from functools import wraps
 import logging
-from datetime import datetime
+import orjson
 from config.constants import HTTP_STATUS, ERROR_MESSAGES
+from utils.helpers import iso_now
 
 logger = logging.getLogger(__name__)
 
+_TIMESTAMP_SLOT = '__TS__'
+
+def prebuilt_json_response(payload, status_code):
+    """
+    Serialize a fixed JSON error body once
+    
+    Returns:
+        Callable building the Response; only the timestamp is filled per call
+    """
+    template = orjson.dumps({**payload, 'timestamp': _TIMESTAMP_SLOT})
+    slot = _TIMESTAMP_SLOT.encode()
+    
+    def build():
+        return Response(
+            template.replace(slot, iso_now().encode(), 1),
+            status=status_code,
+            mimetype='application/json'
+        )
+    
+    return build
+
+_duplicate_entry_response = prebuilt_json_response(
+    {'error': 'Conflict', 'message': 'Duplicate entry'}, HTTP_STATUS['CONFLICT']
+)
+_missing_fields_response = prebuilt_json_response(
+    {'error': 'Bad Request', 'message': 'Missing required fields'}, HTTP_STATUS['BAD_REQUEST']
+)
+
 def error_handler(error):
     """
     Global error handler for Flask application
@@ -23,26 +52,18 @@ def error_handler(error):
     logger.error(f'❌ Error: {str(error)}', exc_info=True)
     
     # Database errors
-    if hasattr(error, 'pgcode'):
-        if error.pgcode == '23505':  # Unique violation
-            return jsonify({
-                'error': 'Conflict',
-                'message': 'Duplicate entry',
-                'timestamp': datetime.utcnow().isoformat()
-            }), HTTP_STATUS['CONFLICT']
-        elif error.pgcode == '23502':  # Not null violation
-            return jsonify({
-                'error': 'Bad Request',
-                'message': 'Missing required fields',
-                'timestamp': datetime.utcnow().isoformat()
-            }), HTTP_STATUS['BAD_REQUEST']
+    sqlstate = getattr(error, 'sqlstate', None)
+    if sqlstate == '23505':  # Unique violation
+        return _duplicate_entry_response()
+    elif sqlstate == '23502':  # Not null violation
+        return _missing_fields_response()
     
     # Validation errors
     if hasattr(error, 'name') and error.name == 'ValidationError':
         return jsonify({
             'error': 'Validation Error',
             'message': str(error),
-            'timestamp': datetime.utcnow().isoformat()
+            'timestamp': iso_now()
         }), HTTP_STATUS['BAD_REQUEST']
     
     # Default error response
@@ -50,7 +71,7 @@ def error_handler(error):
     return jsonify({
         'error': type(error).__name__,
         'message': str(error) or ERROR_MESSAGES['INTERNAL_ERROR'],
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': iso_now()
     }), status_code
 
 def handle_exceptions(f):
@@ -5,9 +5,16 @@ Input validation functions
 """
 
 import re
+from datetime import datetime
+from operator import itemgetter
 from config.constants import ERROR_MESSAGES
 from middleware.error_handler import ValidationError
 
+# Compiled once; these run on every order/reservation POST
+_PHONE_STRIP = re.compile(r'[^\d+]')
+_EMAIL_RE = re.compile(r'[^\s@]+@[^\s@]+\.[^\s@]+')
+_get_name_quantity = itemgetter('name', 'quantity')
+
 
 def validate_phone_number(phone):
     """
@@ -23,7 +30,7 @@ def validate_phone_number(phone):
         raise ValidationError(ERROR_MESSAGES['MISSING_PHONE'])
 
     # Remove non-numeric characters except +
-    cleaned = re.sub(r'[^\d+]', '', phone)
+    cleaned = _PHONE_STRIP.sub('', phone)
 
     # Check if valid length (10+ digits)
     if len(cleaned) < 10:
@@ -37,8 +44,7 @@ def validate_email(email):
     if not email:
         return True
 
-    pattern = r'^[^\s@]+@[^\s@]+\.[^\s@]+$'
-    if not re.match(pattern, email):
+    if not _EMAIL_RE.fullmatch(email):
         raise ValidationError('Invalid email format')
 
     return True
@@ -46,8 +52,6 @@ def validate_email(email):
 
 def validate_date(date_string):
     """Validate date format"""
-    from datetime import datetime
-
     try:
         datetime.fromisoformat(date_string)
         return True
@@ -72,17 +76,17 @@ def validate_order_items(items):
         raise ValidationError(ERROR_MESSAGES['INSUFFICIENT_ITEMS'])
 
     for item in items:
-        if not isinstance(item, dict):
+        # Items are parsed JSON, so exact type checks suffice
+        if type(item) is not dict:
             raise ValidationError(ERROR_MESSAGES['INVALID_ORDER_ITEMS'])
 
-        # Name required
-        name = item.get('name')
-        if not name or not isinstance(name, str):
+        try:
+            name, quantity = _get_name_quantity(item)
+        except KeyError:
             raise ValidationError(ERROR_MESSAGES['INVALID_ORDER_ITEMS'])
 
-        # Quantity must be positive integer
-        quantity = item.get('quantity')
-        if not isinstance(quantity, int) or quantity < 1:
+        # Name required, quantity must be positive integer
+        if not (type(name) is str and name and type(quantity) is int and quantity >= 1):
             raise ValidationError(ERROR_MESSAGES['INVALID_ORDER_ITEMS'])
 
         # TEMPORARY RELAXATION:
@@ -0,0 +1,133 @@
+"""
+White Palace Grill - Numbers for speech
+
+Word <-> number tables shared by the rule-based agent, plus a post-processing
+pass that rewrites prices, phone numbers and clock times in agent replies
+into the words TTS should say.
+"""
+
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
+_ONES = (
+    "zero", "one", "two", "three", "four", "five", "six", "seven", "eight", "nine",
+    "ten", "eleven", "twelve", "thirteen", "fourteen", "fifteen", "sixteen",
+    "seventeen", "eighteen", "nineteen"
+)
+_TENS = ("", "", "twenty", "thirty", "forty", "fifty", "sixty", "seventy", "eighty", "ninety")
+
+# Spoken number words -> values, as callers say party sizes and clock times
+NUMBER_WORDS = MappingProxyType({**{word: n for n, word in enumerate(_ONES) if n}, 'twenty': 20})
+TIME_WORDS = MappingProxyType({**NUMBER_WORDS, 'thirty': 30, 'forty': 40, 'fifty': 50})
+
+# Compiled once; the agent scans these in table order
+NUMBER_WORD_PATTERNS = tuple((re.compile(rf'\b{word}\b'), n) for word, n in NUMBER_WORDS.items())
+TIME_WORD_PATTERNS = tuple((re.compile(rf'\b{word}\b'), n) for word, n in TIME_WORDS.items())
+
+_NON_DIGIT = re.compile(r'\D')
+
+
+@lru_cache(maxsize=1024)
+def number_to_words(n: int) -> str:
+    """0 <= n < 1,000,000 as words ("one hundred twenty-five")"""
+    if n < 20:
+        return _ONES[n]
+    if n < 100:
+        tens, ones = divmod(n, 10)
+        return _TENS[tens] + (f"-{_ONES[ones]}" if ones else "")
+    if n < 1000:
+        hundreds, rest = divmod(n, 100)
+        return f"{_ONES[hundreds]} hundred" + (f" {number_to_words(rest)}" if rest else "")
+    thousands, rest = divmod(n, 1000)
+    return f"{number_to_words(thousands)} thousand" + (f" {number_to_words(rest)}" if rest else "")
+
+
+def _two_digits(n: int) -> str:
+    """Minutes/cents the way they are read after a pause: 5 -> 'oh five'"""
+    return f"oh {_ONES[n]}" if n < 10 else number_to_words(n)
+
+
+@lru_cache(maxsize=1024)
+def price_to_speech(cents: int) -> str:
+    """1899 -> 'eighteen ninety-nine', 1800 -> 'eighteen dollars', 99 -> 'ninety-nine cents'"""
+    dollars, cents = divmod(cents, 100)
+    if dollars == 0:
+        return f"{number_to_words(cents)} cents"
+    if cents == 0:
+        return f"{number_to_words(dollars)} dollar{'s' if dollars != 1 else ''}"
+    return f"{number_to_words(dollars)} {_two_digits(cents)}"
+
+
+@lru_cache(maxsize=1024)
+def time_to_speech(hhmm: str, with_period: bool = True) -> str:
+    """'19:30' -> 'seven thirty PM', '12:00' -> 'twelve PM'; without the period '7:30' -> 'seven thirty'"""
+    hour, minute = map(int, hhmm.split(':'))
+    period = (" AM" if hour < 12 else " PM") if with_period else ""
+    hour = hour % 12 or 12
+    if minute == 0:
+        return f"{number_to_words(hour)}{period}"
+    return f"{number_to_words(hour)} {_two_digits(minute)}{period}"
+
+
+def phone_to_speech(phone: str) -> str:
+    """'(312) 555-1234' -> 'three one two, five five five, one two three four'"""
+    digits = _NON_DIGIT.sub('', phone)[-10:]
+    groups = (digits[:3], digits[3:6], digits[6:])
+    return ", ".join(" ".join(_ONES[int(d)] for d in group) for group in groups)
+
+
+# Street abbreviations as they are read out
+_STREET_WORDS = MappingProxyType({
+    "N": "North", "S": "South", "E": "East", "W": "West",
+    "St": "Street", "Ave": "Avenue", "Blvd": "Boulevard", "Rd": "Road", "Dr": "Drive",
+})
+
+
+def _house_number_to_speech(n: int) -> str:
+    """House numbers in pairs: 1159 -> 'eleven fifty-nine', 1100 -> 'eleven hundred', 305 -> 'three oh five'"""
+    # 2005 reads better as 'two thousand five' than 'twenty oh five'
+    if 100 <= n < 10000 and (n < 1000 or n % 1000 >= 100):
+        high, low = divmod(n, 100)
+        return f"{number_to_words(high)} " + ("hundred" if low == 0 else _two_digits(low))
+    return number_to_words(n)
+
+
+def address_to_speech(address: str) -> str:
+    """'1159 S Canal St' -> 'eleven fifty-nine South Canal Street'"""
+    words = [_STREET_WORDS.get(word.rstrip('.'), word) for word in address.split()]
+    if words and words[0].isdigit():
+        words[0] = _house_number_to_speech(int(words[0]))
+    return " ".join(words)
+
+
+# One pass over a reply: phone numbers, then clock times, then prices
+_SPEECH_RE = re.compile(
+    r"(?P<phone>(?<!\d)(?:\+?1[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}(?!\d))"
+    r"|(?P<time>\b\d{1,2}:\d{2})(?::\d{2})?(?:\s*(?P<period>[AaPp])\.?[Mm]\b\.?)?"
+    r"|\$(?P<dollars>\d+)(?:\.(?P<cents>\d{2}))?\b"
+)
+
+
+def _spoken(match: re.Match) -> str:
+    if match.group('phone'):
+        return phone_to_speech(match.group('phone'))
+
+    if match.group('time'):
+        hour, minute = map(int, match.group('time').split(':'))
+        period = match.group('period')
+        if period and hour <= 12:
+            hour = hour % 12 + (12 if period in 'Pp' else 0)
+        if hour > 23 or minute > 59:
+            return match.group(0)
+        # A bare 7:30 could be morning or evening; only name the half of the
+        # day when the text did, or when a 24-hour clock makes it certain
+        with_period = bool(period) or hour == 0 or hour >= 13
+        return time_to_speech(f"{hour:02d}:{minute:02d}", with_period)
+
+    return price_to_speech(int(match.group('dollars')) * 100 + int(match.group('cents') or 0))
+
+
+def to_speech(text: str) -> str:
+    """Rewrite prices, phone numbers and times in a reply for TTS"""
+    return _SPEECH_RE.sub(_spoken, text)
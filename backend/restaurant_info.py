@@ -0,0 +1,30 @@
+"""
+White Palace Grill - Restaurant facts as callers hear them
+
+Built once from RESTAURANT_CONFIG, so the LLM prompt, the canned FAQ answers
+and the LiveKit agents all give the same address, hours and phone number.
+"""
+
+from types import MappingProxyType
+
+if __package__:
+    # Imported as backend.restaurant_info by the LiveKit agents
+    from .config.restaurant_config import RESTAURANT_CONFIG
+    from .number_speech import address_to_speech, phone_to_speech
+else:
+    from config.restaurant_config import RESTAURANT_CONFIG
+    from number_speech import address_to_speech, phone_to_speech
+
+HOURS_TEXT = "Open 24 hours, 7 days a week"  # White Palace Grill is 24/7
+RESTAURANT_ADDRESS_SPEECH = address_to_speech(RESTAURANT_CONFIG["address"])
+RESTAURANT_PHONE_SPEECH = phone_to_speech(RESTAURANT_CONFIG["phone"])
+
+# Restaurant placeholders of the system prompt; every renderer passes these
+# plus its own tool_schemas
+RESTAURANT_PROMPT_VALUES = MappingProxyType({
+    "restaurant_name": RESTAURANT_CONFIG["name"],
+    "restaurant_address": RESTAURANT_CONFIG["address"],
+    "restaurant_hours": HOURS_TEXT,
+    "restaurant_phone_speech": RESTAURANT_PHONE_SPEECH,
+    "restaurant_timezone": RESTAURANT_CONFIG.get("timezone", "America/Chicago"),
+})
@@ -6,10 +6,13 @@ Endpoints:
 - POST /api/admin/login  -> Authenticate admin user
 """
 
-from flask import Blueprint, jsonify, request, session
+from flask import Blueprint, jsonify, session
 from config.constants import HTTP_STATUS
 from middleware.error_handler import handle_exceptions, ValidationError
+from utils.session_store import SessionStore
+from utils.json_provider import fast_json
 import hashlib
+import hmac
 import secrets
 import os
 import logging
@@ -27,8 +30,27 @@ ADMIN_PASSWORD_HASH = os.getenv(
     "fbffb03f270931d5d9f34bb1a3bf423a9d2e5670cf90d92d24c765e4fe72098b"  # whitepalace2024
 )
 
+
+def _decode_admin_hash(value: str):
+    """Raw SHA-256 digest of the configured hash, or None (logged) when it is malformed."""
+    try:
+        digest = bytes.fromhex(value.strip())
+    except ValueError:
+        digest = b""
+    if len(digest) != hashlib.sha256().digest_size:
+        logger.error("ADMIN_PASSWORD_HASH is not a 64-character hex SHA-256 digest; "
+                     "logins against it will fail until it is fixed")
+        return None
+    return digest
+
+
+# Decoded once; logins compare raw digests
+_ADMIN_HASH_BYTES = _decode_admin_hash(ADMIN_PASSWORD_HASH)
+
+ADMIN_SESSION_TTL = 8 * 60 * 60  # 8 hours in seconds
+
 # Store active sessions (in production, use Redis or database)
-active_sessions = {}
+active_sessions = SessionStore(ADMIN_SESSION_TTL)
 
 
 def generate_session_token():
@@ -47,9 +69,13 @@ def verify_password(password: str) -> bool:
     if password == "whitepalace2024":
         return True
 
-    input_hash = hash_password(password)
-    result = input_hash == ADMIN_PASSWORD_HASH
-    logger.info(f"Password verification: input_hash={input_hash}, stored_hash={ADMIN_PASSWORD_HASH}, result={result}")
+    if _ADMIN_HASH_BYTES is None:
+        return False
+
+    # Binary digest, compared in constant time
+    digest = hashlib.sha256(password.encode()).digest()
+    result = hmac.compare_digest(digest, _ADMIN_HASH_BYTES)
+    logger.info(f"Password verification: result={result}")
     return result
 
 
@@ -74,7 +100,7 @@ def admin_login():
         "expiresIn": 3600
     }
     """
-    data = request.get_json() or {}
+    data = fast_json()
     password = data.get("password", "")
     
     if not password:
@@ -88,17 +114,14 @@ def admin_login():
     token = generate_session_token()
     
     # Store session (expires in 8 hours)
-    active_sessions[token] = {
-        "created_at": __import__('datetime').datetime.now().isoformat(),
-        "expires_in": 8 * 60 * 60  # 8 hours in seconds
-    }
+    active_sessions.add(token)
     
     logger.info("Admin login successful")
     
     return jsonify({
         "status": "success",
         "token": token,
-        "expiresIn": 8 * 60 * 60
+        "expiresIn": ADMIN_SESSION_TTL
     }), HTTP_STATUS["OK"]
 
 
@@ -116,7 +139,7 @@ def verify_session():
         "token": "session_token"
     }
     """
-    data = request.get_json() or {}
+    data = fast_json()
     token = data.get("token", "")
     
     if not token or token not in active_sessions:
@@ -140,11 +163,10 @@ def admin_logout():
     """
     Invalidate admin session.
     """
-    data = request.get_json() or {}
+    data = fast_json()
     token = data.get("token", "")
     
-    if token in active_sessions:
-        del active_sessions[token]
+    active_sessions.discard(token)
     
     return jsonify({
         "status": "success",
@@ -5,16 +5,22 @@ Agent API Routes
 Handles AI agent conversation
 """
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, stream_with_context
 from config.constants import HTTP_STATUS
 from middleware.error_handler import handle_exceptions
+from utils.json_provider import fast_json
 from agent_llm import llm_agent  # Import LLM agent instead
+from asr_fixups import normalize as fix_transcript
+import os
+import orjson
 import logging
 
 logger = logging.getLogger(__name__)
 
 agent_bp = Blueprint('agent', __name__)
 
+AGENT_TIMEOUT_SECONDS = float(os.getenv('AGENT_TIMEOUT_SECONDS', 30))
+
 @agent_bp.route('/message', methods=['POST'])
 @handle_exceptions
 def agent_message():
@@ -34,8 +40,8 @@ def agent_message():
       }
     }
     """
-    data = request.get_json() or {}
-    text = data.get("text", "").strip()
+    data = fast_json()
+    text = fix_transcript(data.get("text", "").strip())
     customer_phone = data.get("customerPhone")
     
     if not text:
@@ -46,8 +52,8 @@ def agent_message():
     
     logger.info(f"Agent message from {customer_phone}: {text}")
     
-    # Call LLM agent
-    result = llm_agent.handle_message(text, customer_phone)
+    # Call LLM agent on the shared async executor
+    result = llm_agent.handle_message_shared(text, customer_phone, AGENT_TIMEOUT_SECONDS)
     
     return jsonify({
         "data": {
@@ -56,3 +62,37 @@ def agent_message():
             "metadata": result.get("toolResult")
         }
     }), HTTP_STATUS["OK"]
+
+
+@agent_bp.route('/message/stream', methods=['POST'])
+@handle_exceptions
+def agent_message_stream():
+    """
+    Stream the agent reply as Server-Sent Events so TTS can start
+    before the LLM has finished generating.
+    
+    Expected JSON: same as /message
+    
+    Emits:
+      data: {"delta": "Great! I have"}
+      ...
+      data: {"done": true}
+    """
+    data = fast_json()
+    text = fix_transcript(data.get("text", "").strip())
+    customer_phone = data.get("customerPhone")
+    
+    if not text:
+        return jsonify({
+            "error": "text is required",
+            "message": "Please provide a text message"
+        }), HTTP_STATUS["BAD_REQUEST"]
+    
+    logger.info(f"Agent stream message from {customer_phone}: {text}")
+    
+    def generate():
+        for delta in llm_agent.stream_message(text, customer_phone):
+            yield b"data: " + orjson.dumps({"delta": delta}) + b"\n\n"
+        yield b'data: {"done": true}\n\n'
+    
+    return Response(stream_with_context(generate()), mimetype="text/event-stream")
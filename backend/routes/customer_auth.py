@@ -15,18 +15,29 @@ from config.constants import HTTP_STATUS
 from middleware.error_handler import handle_exceptions, ValidationError
 from utils.helpers import clean_phone_number
 from middleware.validators import validate_phone_number
+from utils.session_store import SessionStore
+from utils.json_provider import fast_json
 import hashlib
 import secrets
+import time
 import os
 import logging
 import re
+from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 customer_bp = Blueprint('customer', __name__)
 
+CUSTOMER_SESSION_TTL = 24 * 60 * 60  # 24 hours in seconds
+
 # Store active customer sessions (in production, use Redis or database)
-active_customer_sessions = {}
+active_customer_sessions = SessionStore(CUSTOMER_SESSION_TTL)
+
+# Read once; the salt is fixed for the life of the process
+_PASSWORD_SALT_BYTES = os.getenv("PASSWORD_SALT", "whitepalace2024salt").encode()
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
 
 
 def generate_session_token():
@@ -36,14 +47,14 @@ def generate_session_token():
 
 def hash_password(password: str) -> str:
     """Hash password using SHA-256 with salt."""
-    salt = os.getenv("PASSWORD_SALT", "whitepalace2024salt")
-    return hashlib.sha256(f"{password}{salt}".encode()).hexdigest()
+    h = hashlib.sha256(password.encode())
+    h.update(_PASSWORD_SALT_BYTES)
+    return h.hexdigest()
 
 
 def validate_email(email: str) -> bool:
     """Basic email validation."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 
 def validate_password(password: str) -> bool:
@@ -80,7 +91,7 @@ def register_customer():
         }
     }
     """
-    data = request.get_json() or {}
+    data = fast_json()
     phone_raw = data.get("phone", "").strip()
     email = data.get("email", "").strip().lower()
     name = data.get("name", "").strip()
@@ -115,7 +126,6 @@ def register_customer():
     password_hash = hash_password(password)
 
     # Generate a manual ID (simple approach: use timestamp-based ID)
-    import time
     customer_id = int(time.time() * 1000000) % 1000000000  # 9-digit ID based on timestamp
 
     # Insert new customer with explicit ID
@@ -136,7 +146,7 @@ def register_customer():
         "loyalty_points": 0,
         "total_orders": 0,
         "total_spent": 0,
-        "created_at": __import__('datetime').datetime.now()
+        "created_at": datetime.now()
     }
 
     logger.info(f"New customer registered: {phone} ({email})")
@@ -180,7 +190,7 @@ def customer_login():
         "customer": { customer data }
     }
     """
-    data = request.get_json() or {}
+    data = fast_json()
     login = data.get("login", "").strip()
     password = data.get("password", "")
 
@@ -214,24 +224,20 @@ def customer_login():
         raise ValidationError("Invalid login credentials", HTTP_STATUS["UNAUTHORIZED"])
 
     # For demo purposes, accept any password
-    # In production: verify hash_password(password) == stored_hash
+    # In production: verify hmac.compare_digest(hash_password(password), stored_hash)
 
     # Generate session token
     token = generate_session_token()
 
     # Store session (expires in 24 hours for customers)
-    active_customer_sessions[token] = {
-        "customer_id": customer["id"],
-        "created_at": __import__('datetime').datetime.now().isoformat(),
-        "expires_in": 24 * 60 * 60  # 24 hours in seconds
-    }
+    active_customer_sessions.add(token, {"customer_id": customer["id"]})
 
     logger.info(f"Customer login successful: {customer['phone']} ({customer['email']})")
 
     return jsonify({
         "status": "success",
         "token": token,
-        "expiresIn": 24 * 60 * 60,
+        "expiresIn": CUSTOMER_SESSION_TTL,
         "customer": {
             "id": customer["id"],
             "phone": customer["phone"],
@@ -266,16 +272,16 @@ def verify_customer_session():
         "customer": { customer data }
     }
     """
-    data = request.get_json() or {}
+    data = fast_json()
     token = data.get("token", "")
 
-    if not token or token not in active_customer_sessions:
+    session_data = active_customer_sessions.get(token) if token else None
+    if session_data is None:
         return jsonify({
             "status": "error",
             "valid": False
         }), HTTP_STATUS["UNAUTHORIZED"]
 
-    session_data = active_customer_sessions[token]
     customer_id = session_data["customer_id"]
 
     # Get customer data
@@ -322,11 +328,10 @@ def customer_logout():
         "token": "session_token"
     }
     """
-    data = request.get_json() or {}
+    data = fast_json()
     token = data.get("token", "")
 
-    if token in active_customer_sessions:
-        del active_customer_sessions[token]
+    active_customer_sessions.discard(token)
 
     return jsonify({
         "status": "success",
@@ -348,10 +353,10 @@ def get_customer_profile():
     """
     # For now, require token in query param (could be improved with proper auth middleware)
     token = request.args.get("token")
-    if not token or token not in active_customer_sessions:
+    session_data = active_customer_sessions.get(token) if token else None
+    if session_data is None:
         raise ValidationError("Invalid or missing session token", HTTP_STATUS["UNAUTHORIZED"])
 
-    session_data = active_customer_sessions[token]
     customer_id = session_data["customer_id"]
 
     select_sql = """
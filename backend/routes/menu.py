@@ -11,6 +11,7 @@ from config.database import execute_query, get_db_cursor
 from config.constants import HTTP_STATUS, ERROR_MESSAGES, SUCCESS_MESSAGES
 from config.restaurant_config import RESTAURANT_CONFIG
 from middleware.error_handler import handle_exceptions, ValidationError
+from utils.cache import cache_delete_pattern, response_cache, is_ok_response, RESPONSE_CACHE_TIMEOUT
 import logging
 
 logger = logging.getLogger(__name__)
@@ -22,6 +23,7 @@ menu_bp = Blueprint('menu', __name__)
 # GET ALL MENU ITEMS
 # ============================================
 @menu_bp.route('', methods=['GET'])
+@response_cache.cached(timeout=RESPONSE_CACHE_TIMEOUT, query_string=True, response_filter=is_ok_response)
 @handle_exceptions
 def get_all_menu_items():
     """
@@ -106,6 +108,7 @@ def get_all_menu_items():
 # GET SINGLE MENU ITEM
 # ============================================
 @menu_bp.route('/<int:item_id>', methods=['GET'])
+@response_cache.cached(timeout=RESPONSE_CACHE_TIMEOUT, query_string=True, response_filter=is_ok_response)
 @handle_exceptions
 def get_menu_item(item_id):
     """
@@ -146,6 +149,7 @@ def get_menu_item(item_id):
 # GET ITEMS BY CATEGORY
 # ============================================
 @menu_bp.route('/category/<category>', methods=['GET'])
+@response_cache.cached(timeout=RESPONSE_CACHE_TIMEOUT, query_string=True, response_filter=is_ok_response)
 @handle_exceptions
 def get_by_category(category):
     """
@@ -195,6 +199,7 @@ def get_by_category(category):
 # SEARCH MENU ITEMS
 # ============================================
 @menu_bp.route('/search', methods=['GET'])
+@response_cache.cached(timeout=RESPONSE_CACHE_TIMEOUT, query_string=True, response_filter=is_ok_response)
 @handle_exceptions
 def search_menu():
     """
@@ -254,6 +259,7 @@ def search_menu():
 # GET CATEGORIES
 # ============================================
 @menu_bp.route('/categories', methods=['GET'])
+@response_cache.cached(timeout=RESPONSE_CACHE_TIMEOUT, query_string=True, response_filter=is_ok_response)
 @handle_exceptions
 def get_categories():
     """
@@ -339,6 +345,8 @@ def update_availability(item_id):
             raise ValidationError(ERROR_MESSAGES['MENU_ITEM_NOT_FOUND'], HTTP_STATUS['NOT_FOUND'])
         
         logger.info(f'Menu item {item_id} availability updated to {availability}')
+        cache_delete_pattern('menu:*')
+        response_cache.clear()  # only menu views are response-cached
         
         return jsonify({
             'status': 'success',
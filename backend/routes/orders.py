@@ -12,7 +12,7 @@ Endpoints:
 """
 
 from flask import Blueprint, jsonify, request
-from config.database import execute_query, get_db_cursor
+from config.database import execute_query, execute_queries, get_db_cursor
 from config.constants import HTTP_STATUS, ERROR_MESSAGES, SUCCESS_MESSAGES, ORDER_STATUS
 from config.restaurant_config import RESTAURANT_CONFIG
 from middleware.error_handler import handle_exceptions, ValidationError
@@ -79,29 +79,15 @@ def format_order(order_row):
 
 
 # ============================================
-# POST /api/orders  -> Create order
+# INTERNAL: CREATE ORDER RECORD
 # ============================================
-@orders_bp.route('', methods=['POST'])
-@handle_exceptions
-def create_order():
+def create_order_record(data):
     """
-    Create a new order.
+    Validate order data, insert it, and return the formatted order.
 
-    Expected JSON body:
-    {
-      "items": [
-        {"menuItemId": 1, "name": "Classic Burger", "price": 5.95, "quantity": 2},
-        ...
-      ],
-      "orderType": "pickup" | "dine-in" | "delivery",
-      "customerPhone": "+13125551234",
-      "customerName": "John Doe",
-      "deliveryAddress": "optional string for delivery",
-      "specialRequests": "optional notes"
-    }
+    Shared by the POST route and the in-process LLM agent tool.
+    Raises ValidationError on invalid input.
     """
-    data = request.get_json() or {}
-
     # Validate base order fields
     validate_order_data(data)
 
@@ -184,12 +170,40 @@ def create_order():
 
     logger.info(f"Order created: {new_order['order_number']} for {customer_phone}")
 
+    return format_order(new_order)
+
+
+# ============================================
+# POST /api/orders  -> Create order
+# ============================================
+@orders_bp.route('', methods=['POST'])
+@handle_exceptions
+def create_order():
+    """
+    Create a new order.
+
+    Expected JSON body:
+    {
+      "items": [
+        {"menuItemId": 1, "name": "Classic Burger", "price": 5.95, "quantity": 2},
+        ...
+      ],
+      "orderType": "pickup" | "dine-in" | "delivery",
+      "customerPhone": "+13125551234",
+      "customerName": "John Doe",
+      "deliveryAddress": "optional string for delivery",
+      "specialRequests": "optional notes"
+    }
+    """
+    data = request.get_json() or {}
+    order = create_order_record(data)
+
     return (
         jsonify(
             {
                 "status": "success",
                 "message": SUCCESS_MESSAGES["ORDER_CREATED"],
-                "data": format_order(new_order),
+                "data": order,
             }
         ),
         HTTP_STATUS["CREATED"],
@@ -235,11 +249,13 @@ def get_all_orders():
     """
     data_params = params + [limit, offset]
 
-    orders = execute_query(data_sql, tuple(data_params), fetch_all=True)
-
-    # Count query
+    # Page and count go out in one pipelined roundtrip
     count_sql = "SELECT COUNT(*) " + base_sql
-    count_result = execute_query(count_sql, tuple(params), fetch_one=True, fetch_all=False)
+    orders, count_rows = execute_queries(
+        (data_sql, tuple(data_params)),
+        (count_sql, tuple(params)),
+    )
+    count_result = count_rows[0] if count_rows else None
     if isinstance(count_result, dict):
         total = list(count_result.values())[0]
     else:
@@ -336,11 +352,13 @@ def get_orders_by_customer(phone):
     """
     data_params = params + [limit, offset]
 
-    orders = execute_query(data_sql, tuple(data_params), fetch_all=True)
-
-    # Count query
+    # Page and count go out in one pipelined roundtrip
     count_sql = "SELECT COUNT(*) " + base_sql
-    count_result = execute_query(count_sql, tuple(params), fetch_one=True, fetch_all=False)
+    orders, count_rows = execute_queries(
+        (data_sql, tuple(data_params)),
+        (count_sql, tuple(params)),
+    )
+    count_result = count_rows[0] if count_rows else None
     if isinstance(count_result, dict):
         total = list(count_result.values())[0]
     else:
@@ -12,7 +12,7 @@ Endpoints:
 """
 
 from flask import Blueprint, jsonify, request
-from config.database import execute_query, get_db_cursor
+from config.database import execute_query, execute_queries, get_db_cursor
 from config.constants import HTTP_STATUS, ERROR_MESSAGES, RESERVATION_STATUS
 from config.restaurant_config import RESTAURANT_CONFIG, is_restaurant_open
 from middleware.error_handler import handle_exceptions, ValidationError
@@ -163,27 +163,16 @@ def _check_reservation_rules(res_date_str, res_time_str, party_size):
 
 
 # ============================================
-# POST /api/reservations -> Create reservation
+# INTERNAL: CREATE RESERVATION RECORD
 # ============================================
-@reservations_bp.route('', methods=['POST'])
-@handle_exceptions
-def create_reservation():
+def create_reservation_record(data):
     """
-    Create a new reservation.
+    Validate reservation data, enforce rules, insert it, and return the
+    formatted reservation.
 
-    Expected JSON body:
-    {
-      "reservationDate": "2025-12-31",
-      "reservationTime": "19:30",
-      "partySize": 4,
-      "customerName": "John Doe",
-      "customerPhone": "+1 (312) 555-1234",
-      "customerEmail": "optional@email",
-      "specialRequests": "optional string"
-    }
+    Shared by the POST route and the in-process LLM agent tool.
+    Raises ValidationError on invalid input or no availability.
     """
-    data = request.get_json() or {}
-
     # Validate structure and base fields
     validate_reservation_data(data)
 
@@ -249,11 +238,37 @@ def create_reservation():
 
     logger.info(f"Reservation created: {new_res['reservation_number']} for {customer_phone}")
 
+    return format_reservation(new_res)
+
+
+# ============================================
+# POST /api/reservations -> Create reservation
+# ============================================
+@reservations_bp.route('', methods=['POST'])
+@handle_exceptions
+def create_reservation():
+    """
+    Create a new reservation.
+
+    Expected JSON body:
+    {
+      "reservationDate": "2025-12-31",
+      "reservationTime": "19:30",
+      "partySize": 4,
+      "customerName": "John Doe",
+      "customerPhone": "+1 (312) 555-1234",
+      "customerEmail": "optional@email",
+      "specialRequests": "optional string"
+    }
+    """
+    data = request.get_json() or {}
+    reservation = create_reservation_record(data)
+
     return (
         jsonify(
             {
                 "status": "success",
-                "data": format_reservation(new_res),
+                "data": reservation,
             }
         ),
         HTTP_STATUS["CREATED"],
@@ -304,11 +319,13 @@ def get_all_reservations():
     """
     data_params = params + [limit, offset]
 
-    reservations = execute_query(data_sql, tuple(data_params), fetch_all=True)
-
-    # Count query
+    # Page and count go out in one pipelined roundtrip
     count_sql = "SELECT COUNT(*) " + base_sql
-    count_result = execute_query(count_sql, tuple(params), fetch_one=True, fetch_all=False)
+    reservations, count_rows = execute_queries(
+        (data_sql, tuple(data_params)),
+        (count_sql, tuple(params)),
+    )
+    count_result = count_rows[0] if count_rows else None
     if isinstance(count_result, dict):
         total = list(count_result.values())[0]
     else:
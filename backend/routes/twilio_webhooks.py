@@ -173,8 +173,6 @@ def voice_agent():
     # 2. Start the AI agent session in the room
     try:
         # Start agent synchronously (LiveKit requires main thread for plugins)
-        import asyncio
-
         # Create event loop if one doesn't exist
         try:
             loop = asyncio.get_event_loop()
@@ -20,6 +20,8 @@ from livekit import agents, rtc
 from livekit.agents import stt, llm, tts, vad
 from livekit.agents.voice import AgentSession
 from agent import RestaurantAgent
+from asr_fixups import normalize as fix_transcript
+from number_speech import to_speech
 from utils.helpers import clean_phone_number
 
 logger = logging.getLogger(__name__)
@@ -45,12 +47,17 @@ class RestaurantVoiceAgent(agents.Agent):
             # Process through restaurant agent
             try:
                 customer_phone = self.customer_phone or "anonymous"
-                response = self.restaurant_agent.handle_message(event.text, customer_phone)
+                # RestaurantAgent blocks on HTTP/DB; run it off the event loop so
+                # STT keeps receiving audio while the turn is processed
+                response = await asyncio.to_thread(
+                    self.restaurant_agent.handle_message, fix_transcript(event.text), customer_phone
+                )
                 agent_response = response.get('response', '')
 
                 if agent_response:
                     logger.info(f"🗣️ Agent response: '{agent_response}'")
-                    await self.say(agent_response, allow_interruptions=True)
+                    # Prices, phone numbers and times are spelled out before TTS
+                    await self.say(to_speech(agent_response), allow_interruptions=True)
                 else:
                     await self.say("I'm sorry, I didn't understand that. Could you please repeat?", allow_interruptions=True)
 
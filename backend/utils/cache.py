@@ -0,0 +1,153 @@
+"""
+Redis cache helpers
+A short-lived per-process copy sits in front of Redis; when REDIS_URL is not set
+(or Redis is down) only that copy is used. response_cache falls back to a
+per-process SimpleCache
+"""
+
+import os
+import time
+import orjson
+import logging
+import threading
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from flask_caching import Cache
+
+logger = logging.getLogger(__name__)
+
+# Whole-response cache for read-heavy GET views; bound to the app in app.py
+response_cache = Cache()
+
+RESPONSE_CACHE_TIMEOUT = int(os.getenv('RESPONSE_CACHE_TIMEOUT', 60))
+
+_redis_client = None
+_redis_checked = False
+
+# Per-process tier: hits skip the Redis round trip. Entries live at most
+# LOCAL_CACHE_TTL seconds so other workers' copies go stale only briefly
+# after an invalidation. An LRU shared by every request thread, so all access
+# holds _local_lock
+LOCAL_CACHE_TTL = int(os.getenv('LOCAL_CACHE_TTL', 30))
+LOCAL_CACHE_MAX_ENTRIES = 256
+_local_cache = OrderedDict()
+_local_lock = threading.Lock()
+
+
+def get_redis_client():
+    """
+    Lazily connect to Redis
+
+    Returns:
+        redis.Redis client, or None when REDIS_URL is unset or unreachable
+    """
+    global _redis_client, _redis_checked
+    if _redis_checked:
+        return _redis_client
+
+    _redis_checked = True
+    redis_url = os.getenv('REDIS_URL')
+    if not redis_url:
+        return None
+
+    try:
+        import redis
+
+        client = redis.Redis.from_url(redis_url)
+        client.ping()
+        _redis_client = client
+        logger.info('✅ Redis connected')
+    except Exception as e:
+        logger.error(f'❌ Redis unavailable: {str(e)}')
+    return _redis_client
+
+
+def _local_get(key):
+    with _local_lock:
+        entry = _local_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] > time.monotonic():
+            _local_cache.move_to_end(key)
+            return entry[1]
+        del _local_cache[key]
+        return None
+
+
+def _local_set(key, value, ttl):
+    entry = (time.monotonic() + min(ttl, LOCAL_CACHE_TTL), value)
+    with _local_lock:
+        _local_cache[key] = entry
+        _local_cache.move_to_end(key)
+        while len(_local_cache) > LOCAL_CACHE_MAX_ENTRIES:
+            _local_cache.popitem(last=False)
+
+
+def cache_get(key):
+    """Return the cached JSON value for key, or None on miss"""
+    value = _local_get(key)
+    if value is not None:
+        return value
+
+    client = get_redis_client()
+    if client is None:
+        return None
+    try:
+        raw = client.get(key)
+        if not raw:
+            return None
+        value = orjson.loads(raw)
+        _local_set(key, value, LOCAL_CACHE_TTL)
+        return value
+    except Exception as e:
+        logger.warning(f'Cache read failed for {key}: {str(e)}')
+        return None
+
+
+def cache_set(key, value, ttl):
+    """Store value as JSON under key for ttl seconds"""
+    _local_set(key, value, ttl)
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        client.setex(key, ttl, orjson.dumps(value, default=str))
+    except Exception as e:
+        logger.warning(f'Cache write failed for {key}: {str(e)}')
+
+
+def cache_delete_pattern(pattern):
+    """Delete every cached key matching a glob pattern (e.g. 'menu:*')"""
+    with _local_lock:
+        for key in [key for key in _local_cache if fnmatchcase(key, pattern)]:
+            del _local_cache[key]
+
+    client = get_redis_client()
+    if client is None:
+        return
+    try:
+        keys = list(client.scan_iter(match=pattern))
+        if keys:
+            client.delete(*keys)
+    except Exception as e:
+        logger.warning(f'Cache invalidation failed for {pattern}: {str(e)}')
+
+
+def response_cache_config():
+    """Flask-Caching config: shared Redis when REDIS_URL is set, else per-process"""
+    redis_url = os.getenv('REDIS_URL')
+    config = {
+        'CACHE_DEFAULT_TIMEOUT': RESPONSE_CACHE_TIMEOUT,
+        'CACHE_KEY_PREFIX': 'view:',
+    }
+    if redis_url:
+        config.update({'CACHE_TYPE': 'RedisCache', 'CACHE_REDIS_URL': redis_url})
+    else:
+        config['CACHE_TYPE'] = 'SimpleCache'
+    return config
+
+
+def is_ok_response(rv):
+    """response_filter for response_cache: only cache successful views"""
+    status = rv[1] if isinstance(rv, tuple) else getattr(rv, 'status_code', 200)
+    return status == 200
@@ -0,0 +1,174 @@
+"""
+Conversation history storage for the LLM agent
+Redis-backed when REDIS_URL is set, in-memory otherwise (dev mode)
+"""
+
+import os
+import time
+import orjson
+import logging
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from utils.cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+HISTORY_KEY_PREFIX = 'history:'
+RESPONSE_ID_KEY_PREFIX = 'response:'
+INTENT_KEY_PREFIX = 'intent:'
+DEFAULT_TTL_SECONDS = int(os.getenv('CONVERSATION_TTL', 3600))
+DEFAULT_MAX_MESSAGES = 20
+
+
+class InMemoryConversationStore:
+    """
+    Process-local history store, used when Redis is not configured
+
+    Each session is a bounded deque, so appends evict the oldest messages
+    without slicing or copying. Response ids expire after ttl seconds, like
+    the Redis keys do.
+    """
+
+    def __init__(self, max_messages: int = DEFAULT_MAX_MESSAGES, ttl: int = DEFAULT_TTL_SECONDS):
+        self.max_messages = max_messages
+        self.ttl = ttl
+        self._history: Dict[str, Deque[Dict[str, Any]]] = {}
+        # session -> (expires_at, response id), oldest first: every id gets the
+        # same TTL and a re-set moves the session to the end
+        self._last_response_ids: Dict[str, Tuple[float, str]] = {}
+        self._response_ids_lock = threading.Lock()
+        self._intents: Dict[str, str] = {}
+
+    def get(self, session_key: str) -> List[Dict[str, Any]]:
+        """Return a copy of the stored messages for a session"""
+        return list(self._history.get(session_key, ()))
+
+    def append(self, session_key: str, *messages: Dict[str, Any]) -> None:
+        """Append messages to a session's history"""
+        history = self._history.get(session_key)
+        if history is None:
+            history = self._history[session_key] = deque(maxlen=self.max_messages)
+        history.extend(messages)
+
+    def trim(self, session_key: str, n: int = DEFAULT_MAX_MESSAGES) -> None:
+        """Keep only the last n messages of a session (a no-op at or above max_messages)"""
+        history = self._history.get(session_key)
+        while history is not None and len(history) > n:
+            history.popleft()
+
+    def get_last_response_id(self, session_key: str) -> Optional[str]:
+        """Return the id of the session's latest OpenAI response, if any"""
+        entry = self._last_response_ids.get(session_key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def set_last_response_id(self, session_key: str, response_id: str) -> None:
+        """Remember the session's latest OpenAI response id"""
+        now = time.monotonic()
+        ids = self._last_response_ids
+        with self._response_ids_lock:
+            ids.pop(session_key, None)
+            # Expired ids are all at the front
+            while ids:
+                oldest = next(iter(ids))
+                if ids[oldest][0] > now:
+                    break
+                del ids[oldest]
+            ids[session_key] = (now + self.ttl, response_id)
+
+    def get_intent(self, session_key: str) -> Optional[str]:
+        """Return the flow the session is in (ORDER, RESERVATION, ...), if any"""
+        return self._intents.get(session_key)
+
+    def set_intent(self, session_key: str, intent: Optional[str]) -> None:
+        """Remember the session's current flow (None when it has finished)"""
+        if intent is None:
+            self._intents.pop(session_key, None)
+        else:
+            self._intents[session_key] = intent
+
+    def clear(self, session_key: str) -> None:
+        """Drop a session's history"""
+        self._history.pop(session_key, None)
+        with self._response_ids_lock:
+            self._last_response_ids.pop(session_key, None)
+        self._intents.pop(session_key, None)
+
+
+class RedisConversationStore:
+    """Redis LIST per session: RPUSH to append, LTRIM to bound, EXPIRE for TTL"""
+
+    def __init__(self, client, ttl: int = DEFAULT_TTL_SECONDS):
+        self.client = client
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(session_key: str) -> str:
+        return f'{HISTORY_KEY_PREFIX}{session_key}'
+
+    def get(self, session_key: str) -> List[Dict[str, Any]]:
+        """Return the stored messages for a session"""
+        raw = self.client.lrange(self._key(session_key), 0, -1)
+        return [orjson.loads(item) for item in raw]
+
+    def append(self, session_key: str, *messages: Dict[str, Any]) -> None:
+        """Append messages to a session's history and refresh its TTL"""
+        if not messages:
+            return
+        key = self._key(session_key)
+        pipe = self.client.pipeline()
+        pipe.rpush(key, *(orjson.dumps(m, default=str) for m in messages))
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+
+    def trim(self, session_key: str, n: int = DEFAULT_MAX_MESSAGES) -> None:
+        """Keep only the last n messages of a session"""
+        self.client.ltrim(self._key(session_key), -n, -1)
+
+    def get_last_response_id(self, session_key: str) -> Optional[str]:
+        """Return the id of the session's latest OpenAI response, if any"""
+        value = self.client.get(f'{RESPONSE_ID_KEY_PREFIX}{session_key}')
+        return value.decode() if value else None
+
+    def set_last_response_id(self, session_key: str, response_id: str) -> None:
+        """Remember the session's latest OpenAI response id"""
+        self.client.setex(f'{RESPONSE_ID_KEY_PREFIX}{session_key}', self.ttl, response_id)
+
+    def get_intent(self, session_key: str) -> Optional[str]:
+        """Return the flow the session is in (ORDER, RESERVATION, ...), if any"""
+        value = self.client.get(f'{INTENT_KEY_PREFIX}{session_key}')
+        return value.decode() if value else None
+
+    def set_intent(self, session_key: str, intent: Optional[str]) -> None:
+        """Remember the session's current flow (None when it has finished)"""
+        if intent is None:
+            self.client.delete(f'{INTENT_KEY_PREFIX}{session_key}')
+        else:
+            self.client.setex(f'{INTENT_KEY_PREFIX}{session_key}', self.ttl, intent)
+
+    def clear(self, session_key: str) -> None:
+        """Drop a session's history"""
+        self.client.delete(
+            self._key(session_key),
+            f'{RESPONSE_ID_KEY_PREFIX}{session_key}',
+            f'{INTENT_KEY_PREFIX}{session_key}'
+        )
+
+
+def create_conversation_store(max_messages: int = DEFAULT_MAX_MESSAGES):
+    """
+    Build the conversation store for this process
+
+    Returns:
+        RedisConversationStore if REDIS_URL is set and reachable,
+        otherwise InMemoryConversationStore
+    """
+    client = get_redis_client()
+    if client is None:
+        logger.info('Redis not available, using in-memory conversation history')
+        return InMemoryConversationStore(max_messages)
+
+    return RedisConversationStore(client)
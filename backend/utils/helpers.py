@@ -3,7 +3,8 @@ Helper functions for the application
 """
 
 import uuid
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 import re
 
 def generate_order_id():
@@ -24,7 +25,7 @@ def format_phone_number(phone):
     Returns:
         Formatted phone number
     """
-    cleaned = re.sub(r'[^\d]', '', phone)
+    cleaned = clean_phone_number(phone)
     
     if len(cleaned) == 10:
         return f"({cleaned[:3]}) {cleaned[3:6]}-{cleaned[6:]}"
@@ -112,7 +113,21 @@ def format_datetime(date_obj):
     """Format datetime object to readable string"""
     return date_obj.strftime('%Y-%m-%d %H:%M:%S')
 
+_iso_cache = [0, '']
+
+def iso_now():
+    """Current UTC time as an ISO string, formatted at most once per second"""
+    now = int(time.time())
+    if now != _iso_cache[0]:
+        _iso_cache[:] = [now, datetime.fromtimestamp(now, timezone.utc).isoformat()]
+    return _iso_cache[1]
+
+# Deletes every ASCII character except 0-9 in one C-level pass
+_PHONE_DIGITS_ONLY = str.maketrans('', '', ''.join(chr(i) for i in range(128) if not chr(i).isdigit()))
+
 def clean_phone_number(phone):
     """Remove all non-numeric characters from phone number"""
+    if phone.isascii():
+        return phone.translate(_PHONE_DIGITS_ONLY)
     return re.sub(r'[^\d]', '', phone)
 
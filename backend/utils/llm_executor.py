@@ -0,0 +1,96 @@
+"""
+Shared async executor for LLM work
+One background event loop serves every session: Flask worker threads submit
+coroutines to it, and OpenAI calls are capped by a semaphore and a
+requests-per-minute token bucket.
+"""
+
+import os
+import time
+import asyncio
+import logging
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import asynccontextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at rate_per_minute"""
+
+    def __init__(self, rate_per_minute):
+        self.capacity = float(rate_per_minute)
+        self.tokens = float(rate_per_minute)
+        self.refill_per_second = rate_per_minute / 60.0
+        self.updated_at = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+
+    async def acquire(self, amount=1):
+        """Wait until `amount` tokens are available and take them"""
+        while True:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return
+            await asyncio.sleep((amount - self.tokens) / self.refill_per_second)
+
+
+class AsyncRequestExecutor:
+    """Background event loop with shared concurrency and rate limits"""
+
+    def __init__(self, max_concurrency, max_requests_per_minute):
+        self.max_concurrency = max_concurrency
+        self.max_requests_per_minute = max_requests_per_minute
+        self._loop = None
+        self._lock = threading.Lock()
+        self._semaphore = None
+        self._bucket = None
+
+    def _ensure_started(self):
+        if self._loop is not None:
+            return self._loop
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._bucket = TokenBucket(self.max_requests_per_minute)
+                threading.Thread(target=loop.run_forever, name='llm-executor', daemon=True).start()
+                self._loop = loop
+                logger.info(
+                    f'✅ LLM executor started (concurrency={self.max_concurrency}, '
+                    f'rpm={self.max_requests_per_minute})'
+                )
+        return self._loop
+
+    def run(self, coro, timeout=None):
+        """
+        Run a coroutine on the shared loop and block the calling thread for its result
+
+        Args:
+            coro: Coroutine to execute
+            timeout: Seconds to wait before cancelling (None waits forever)
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    @asynccontextmanager
+    async def limit(self):
+        """Hold a concurrency slot and one rate-limit token around a provider call"""
+        async with self._semaphore:
+            await self._bucket.acquire()
+            yield
+
+
+llm_executor = AsyncRequestExecutor(
+    max_concurrency=int(os.getenv('LLM_MAX_CONCURRENCY', 32)),
+    max_requests_per_minute=int(os.getenv('OPENAI_MAX_RPM', 500)),
+)
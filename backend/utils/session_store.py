@@ -0,0 +1,71 @@
+"""
+In-process session token store
+Tokens expire after a fixed TTL; expired ones are dropped lazily on access,
+oldest first, so no sweep over every token is ever needed
+"""
+
+import heapq
+import time
+import threading
+
+
+class SessionStore:
+    """
+    Session tokens with a fixed time-to-live
+
+    Stored as parallel maps: token -> expiry (epoch seconds) for every token,
+    and token -> data only for tokens that carry any, so a bare token costs
+    one float. A heap of (expires_at, token) keeps the next token to expire
+    on top; every lookup first pops the expired ones, so a token is never
+    seen past its expiry. Safe to share between request threads.
+    """
+
+    def __init__(self, ttl_seconds):
+        self.ttl_seconds = ttl_seconds
+        self._expires_at = {}
+        self._data = {}
+        self._expiries = []
+        self._lock = threading.Lock()
+
+    def _evict_expired(self, now):
+        expiries = self._expiries
+        while expiries and expiries[0][0] <= now:
+            expires_at, token = heapq.heappop(expiries)
+            # Logged-out tokens leave their heap entry behind; skip those
+            if self._expires_at.get(token) == expires_at:
+                self._expires_at.pop(token, None)
+                self._data.pop(token, None)
+
+    def add(self, token, data=None):
+        """Store a token for ttl_seconds; returns its expiry (epoch seconds)"""
+        now = time.time()
+        with self._lock:
+            self._evict_expired(now)
+            expires_at = now + self.ttl_seconds
+            self._expires_at[token] = expires_at
+            if data is not None:
+                self._data[token] = data
+            heapq.heappush(self._expiries, (expires_at, token))
+        return expires_at
+
+    def get(self, token):
+        """Data stored with a live token, or None when unknown, expired or data-less"""
+        with self._lock:
+            self._evict_expired(time.time())
+            return self._data.get(token)
+
+    def discard(self, token):
+        """Forget a token; unknown tokens are ignored"""
+        with self._lock:
+            self._expires_at.pop(token, None)
+            self._data.pop(token, None)
+
+    def __contains__(self, token):
+        with self._lock:
+            self._evict_expired(time.time())
+            return token in self._expires_at
+
+    def __len__(self):
+        with self._lock:
+            self._evict_expired(time.time())
+            return len(self._expires_at)
@@ -17,7 +17,9 @@ socketio = None
 def init_socketio(app):
     """Initialize SocketIO with Flask app"""
     global socketio
-    socketio = SocketIO(app, cors_allowed_origins=[
+    # Native threads: the DB pool and the shared asyncio LLM executor need
+    # real threads, which eventlet/gevent monkey patching would turn green
+    socketio = SocketIO(app, async_mode=os.getenv('SOCKETIO_ASYNC_MODE', 'threading'), cors_allowed_origins=[
         "http://localhost:3000",
         "http://localhost:5000",
         "http://localhost:5173",
@@ -183,6 +183,7 @@ CREATE INDEX idx_reservations_restaurant ON reservations(restaurant_id);
 CREATE INDEX idx_reservations_customer_phone ON reservations(customer_phone);
 CREATE INDEX idx_reservations_date ON reservations(reservation_date);
 CREATE INDEX idx_reservations_status ON reservations(status);
+CREATE INDEX idx_reservations_restaurant_date_status ON reservations(restaurant_id, reservation_date, status);
 
 CREATE INDEX idx_conversations_restaurant ON conversations(restaurant_id);
 CREATE INDEX idx_conversations_customer_phone ON conversations(customer_phone);